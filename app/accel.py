@@ -1,51 +1,123 @@
 # MIT license; Copyright (c) 2023 Ondrej Sienczak
 from .task import Task
 from drv import accel as accel_drv
-from uasyncio import sleep_ms, Event
-from config import ACC_COMPENSATE, ACC_TRANSFORM
+from drv.adxl345 import INT_ACTIVITY, INT_INACTIVITY
+from machine import Pin
+from uasyncio import sleep_ms, ThreadSafeFlag
+from utime import ticks_ms
+from config import ACC_COMPENSATE, ACC_TRANSFORM, ACC_FILTER, PIN_INT
+from config import ACC_ACTIVITY, ACC_INACTIVITY, ACC_INACT_TIME, ACC_LOW_RATE
+from config import ACC_RECORD, ACC_RECORD_SIZE
 from common.atools import core_task
+from common.heapmon import heapmon
+from common.accrec import AccRecorder
+from common.accring import AccelRing
+from micropython import const
 
 
-class AccelSync:
-    def __init__(self, accel):
-        self.event = Event()
-        self.accel = accel
-
-    def __aiter__(self):
-        return self
-
-    async def __anext__(self):
-        await self.event.wait()
-        self.event.clear()
-        return self.accel.gravity
+_BATCH = const(8)  # Samples collected per poll
+_POLL_MAX = const(100)  # Longest poll period [ms] (keeps latency at low rates)
 
 
 class Accel(Task):
     def __init__(self):
         super().__init__("accel")
-        self.gravity = b"\0\0\0"
-        self.grav45 = b"\0\0"
-        self.listeners = list()
-        self.transform = bytes([abs(i) - 1 for i in ACC_TRANSFORM]), tuple(
-            [1 if i > 0 else -1 for i in ACC_TRANSFORM]
-        )
+        # Ring of samples read from FIFO (see AccelSync) - gravity vectors
+        # are updated in place, so they can be referenced by other tasks
+        self.samples = AccelRing(ACC_TRANSFORM, ACC_FILTER)
+        self.gravity = self.samples.gravity
+        self.grav45 = self.samples.grav45
         accel_drv.compensate(*ACC_COMPENSATE)
 
+        # Raw samples are recorded for later replay in emulation (see ReplayI2C)
+        self._recorder = (
+            AccRecorder(ACC_RECORD, ACC_RECORD_SIZE) if ACC_RECORD else None
+        )
+
+        # Sample rates requested by tasks
+        self._rates = dict()
+        self._hz = 0
+        self._want = ACC_LOW_RATE
+
+        # Sleep when not moved for a while (when interrupt pin is connected)
+        self.idle = False
+        self._motion = None
+        self._pending = False
+        if PIN_INT is not None:
+            self._motion = ThreadSafeFlag()
+            self._pin = Pin(PIN_INT, Pin.IN)
+            self._pin.irq(self._irq, Pin.IRQ_FALLING)
+            accel_drv.motion(ACC_ACTIVITY, ACC_INACTIVITY, ACC_INACT_TIME)
+
     @core_task
     async def __call__(self):
-        t, s = self.transform
+        """Accelerometer task reading batches of samples (see :class:`AccelRing`)"""
+        samples = self.samples
         while True:
-            g = accel_drv.acc()
-            g = [g[t[i]] * s[i] for i in range(3)]
-            self.gravity = g
-            self.grav45 = -g[2] - g[0], -g[0] + g[2]
+            if self._pending:
+                await self._sleep()
+
+            if heapmon:
+                mark = heapmon.mark()
+
+            n = accel_drv.drain()
+            now = ticks_ms()
+
+            if self._recorder is not None and n:
+                if not self._recorder.write(
+                    now, accel_drv.period, accel_drv.samples, n
+                ):
+                    self._recorder = None
+
+            samples.push(accel_drv, n, now)
+
+            # New rate is set after batch is read (all samples of batch share period)
+            if self._want != self._hz:
+                self._hz = self._want
+                accel_drv.rate(self._hz)
+
+            if heapmon:
+                heapmon.account("accel", mark)
+
+            await sleep_ms(min(accel_drv.period * _BATCH, _POLL_MAX))
+
+    def rate(self, owner: Task, hz: int) -> None:
+        """Request sample rate.
+
+        Accelerometer samples at maximal rate requested by tasks, or at
+        ``ACC_LOW_RATE`` when nobody needs more. Accelerometer is polled once per
+        few samples, so poll period changes together with rate (but it never
+        exceeds 100 ms). New rate is used since next poll.
+
+        :param owner:    Task requesting rate
+        :param hz:       Requested rate in Hz (0 to withdraw request)
+        """
+        rates = self._rates
+        if rates.get(owner, 0) == hz:
+            return
+
+        rates[owner] = hz
+        want = ACC_LOW_RATE
+        for r in rates.values():
+            if r > want:
+                want = r
+        self._want = want
+
+    async def _sleep(self) -> None:
+        """Sleep till motion when accelerometer reports inactivity"""
+        self._pending = False
+        src = accel_drv.interrupts()
+        self.idle = (src & (INT_ACTIVITY | INT_INACTIVITY)) == INT_INACTIVITY
 
-            for event in self.listeners:
-                event.event.set()
+        while self.idle:
+            await self._motion.wait()
+            self._pending = False
+            self.idle = not accel_drv.interrupts() & INT_ACTIVITY
 
-            await sleep_ms(100)
+    def _irq(self, _) -> None:
+        # Interrupt handler - just wake up task
+        self._pending = True
+        self._motion.set()
 
     def register(self):
-        event = AccelSync(self)
-        self.listeners.append(event)
-        return event
+        return self.samples.register()
@@ -1,8 +1,10 @@
 # MIT license; Copyright (c) 2023 Ondrej Sienczak
 from .task import Task
-from common.matrixbuffer import MatrixBuffer
-from common.glyphs import glyphs_clock
+from common.zoombuffer import ZoomBuffer
+from common.clockface import ClockFace
+from common.anim import Transition
 from common.atools import core_task
+from drv import display
 from machine import RTC
 from uasyncio import sleep_ms, create_task
 from utime import ticks_ms
@@ -11,6 +13,7 @@ from config import (
     NTP_SERVER,
     TIME_ZONE_HOURS,
     CLOCK_BRIGHT_TIME,
+    CLOCK_FADE,
     BRIGHTNESS,
     WIFI_TIMEOUT,
     NTP_RETRY,
@@ -73,7 +76,9 @@ class WiFi:
 class Clock(Task):
     def __init__(self):
         super().__init__("clock")
-        self.display = MatrixBuffer(), MatrixBuffer()
+        self.display = ZoomBuffer(*display.size(0)), ZoomBuffer(*display.size(1))
+        self.face = ClockFace()
+        self.fades = Transition(), Transition()
         self.rtc = RTC()
         self.last = -1, -1
         self.shift = 0
@@ -94,6 +99,7 @@ class Clock(Task):
         # RTC for synchronization only.
         while True:
             self._update_time()
+            await self._fade_time()
             self._draw_time()
             self.dispman.keep_alive(self)
             await sleep_ms(1000)
@@ -150,10 +156,26 @@ class Clock(Task):
 
     def _update_time(self):
         self.now = ticks_ms() - self.shift
-        while self.now > 86400000:
+        while self.now >= 86400000:
             self.shift += 86400000
             self.now -= 86400000
 
+    async def _fade_time(self):
+        h, m = divmod(self.now, 3600000)
+        m //= 60000
+
+        if self.last != (h, m) and self.last != (-1, -1):
+            a0, a1 = self.fades
+            d0, d1 = self.display
+            await self.dispman.play(
+                self,
+                (
+                    a0.fade(d0.bitmap, self.face.hours(h)),
+                    a1.fade(d1.bitmap, self.face.minutes(m)),
+                ),
+                CLOCK_FADE,
+            )
+
     def _draw_time(self):
         h, m = divmod(self.now, 3600000)
         m //= 60000
@@ -162,15 +184,8 @@ class Clock(Task):
         if self.last != now:
             self.last = now
 
-            self.display[0].blit(glyphs_clock[h % 10], 0, 0)
-            if h > 9:
-                self.display[0].blit(glyphs_clock[h // 10 * 10], 0, 0, 0)
-
-            self.display[1].blit(glyphs_clock[m % 10], 0, 0)
-            if m > 9:
-                self.display[1].blit(glyphs_clock[m // 10 * 10], 0, 0, 0)
-            else:
-                self.display[1].blit(glyphs_clock[100], 0, 0, 0)
+            self.display[0].load(self.face.hours(h))
+            self.display[1].load(self.face.minutes(m))
 
             self.dispman.draw(self)
             self.dispman.brightness(
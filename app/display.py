@@ -1,25 +1,56 @@
 # MIT license; Copyright (c) 2023 Ondrej Sienczak
 from .task import Task
 from common.matrixbuffer import MatrixBuffer
+from common.anim import FRAMES
 from common.atools import core_task
 from drv import display
-from uasyncio import sleep_ms
-from random import getrandbits
-from config import DIMM_TIME, SAVER_TIME
+from uasyncio import sleep_ms, create_task, Event
+from utime import ticks_ms, ticks_add, ticks_diff
+from common.xorshift import rng
+from micropython import const
+from config import DIMM_TIME, SAVER_TIME, DISPLAY_PERIOD
+
+
+# Brightness fade curves
+FADE_LINEAR = const(0)
+FADE_GAMMA = const(1)
+_FADE_PULSE = const(2)
+
+# Period of brightness effects in milliseconds
+_FADE_TICK = const(20)
+
+# Timing of one pulse (ramp up, hold, ramp down) in milliseconds
+_PULSE_RAMP = const(200)
+_PULSE_HOLD = const(100)
+_PULSE = const(2 * _PULSE_RAMP + _PULSE_HOLD)
 
 
 class DispMan(Task):
-    """Manage display ownership"""
+    """Manage display ownership
+
+    Display is not refreshed directly by drawing task. Drawn frame is posted to
+    one slot mailbox instead and it is shown later by flush task (at most one
+    frame per ``DISPLAY_PERIOD``). Frame posted meanwhile replaces previous one,
+    but nothing is lost as display buffers collect dirty rows till they are shown.
+    """
 
     def __init__(self):
         super().__init__("dispman")
         self._owner = None
         self._brights = dict()
         self._saver = 0
-        self.display = MatrixBuffer(), MatrixBuffer()
+        self.display = MatrixBuffer(*display.size(0)), MatrixBuffer(*display.size(1))
+        self.rng = rng
+        self._frame = None
+        self._ready = Event()
+        self._effects = dict()
+        self._effect = Event()
 
     @core_task
     async def __call__(self):
+        create_task(self._flush())
+        create_task(self._fader())
+
         while True:
             await sleep_ms(1000)
             self._saver += 1
@@ -37,6 +68,7 @@ class DispMan(Task):
     @owner.setter
     def owner(self, owner: Task):
         self._owner = owner
+        self._frame = None
         for d in owner.display:
             d.force_all()
         display.brightness = self._brights.get(owner, 0)
@@ -48,7 +80,32 @@ class DispMan(Task):
         or DPMS screen saver.
         """
         if owner == self._owner and self._saver < SAVER_TIME:
-            display.show(*owner.display)
+            self._post(owner.display)
+
+    async def play(self, owner: Task, anims: tuple, period: int) -> None:
+        """Play precomputed transitions on owner displays
+
+        Frames are just loaded into display buffers in fixed frame period.
+        When owner does not own display, then only final frames are loaded.
+
+        :param owner:   Owner of displays
+        :param anims:   Transitions (one for each display, ``None`` when display is not animated)
+        :param period:  Frame period in milliseconds
+        """
+        display = owner.display
+        start = 0 if owner == self._owner else FRAMES - 1
+        t = ticks_ms()
+
+        for i in range(start, FRAMES):
+            for d in range(len(display)):
+                if anims[d] is not None:
+                    display[d].load(anims[d].frame(i))
+
+            self.draw(owner)
+
+            if i < FRAMES - 1:
+                t = ticks_add(t, period)
+                await sleep_ms(max(0, ticks_diff(t, ticks_ms())))
 
     def brightness(self, owner: Task, value: float) -> None:
         """Set brightness to be used with next display shot
@@ -60,6 +117,49 @@ class DispMan(Task):
         if owner == self._owner:
             display.brightness = 0 if self._saver > DIMM_TIME else value
 
+    def fade(
+        self, owner: Task, value: int, duration: int, curve: int = FADE_LINEAR
+    ) -> None:
+        """Fade brightness of owner from current value to new one
+
+        Request replaces running brightness effect of the owner.
+
+        :param owner:       Owner requesting to display stuff
+        :param value:       Final brightness value (0 - 15)
+        :param duration:    Duration of fade in milliseconds
+        :param curve:       Fade curve (``FADE_LINEAR`` or ``FADE_GAMMA``)
+        """
+        v0 = self._brights.get(owner, 0)
+        self._effects[owner] = [curve, ticks_ms(), duration, v0, value, 0]
+        self._effect.set()
+
+    def pulse(self, owner: Task, count: int, value: int) -> None:
+        """Pulse brightness of owner and then fade to final brightness
+
+        When owner is already pulsing, then requested pulses are appended to
+        running ones (but there are never more than ``count`` pulses pending).
+
+        :param owner:   Owner requesting to display stuff
+        :param count:   Count of pulses
+        :param value:   Final brightness value (0 - 15)
+        """
+        e = self._effects.get(owner)
+        if e is not None and e[0] == _FADE_PULSE:
+            done = ticks_diff(ticks_ms(), e[1]) // _PULSE
+            e[5] = min(e[5] + count, done + 1 + count)
+            e[2] = e[5] * _PULSE + _PULSE_RAMP
+            e[4] = value
+        else:
+            self._effects[owner] = [
+                _FADE_PULSE,
+                ticks_ms(),
+                count * _PULSE + _PULSE_RAMP,
+                0,
+                value,
+                count,
+            ]
+            self._effect.set()
+
     def keep_alive(self, owner: Task = None) -> None:
         """Reset display keep alive flag"""
         if owner is None:
@@ -67,16 +167,96 @@ class DispMan(Task):
 
         if owner == self._owner:
             display.brightness = self._brights.get(owner, 0)
+
+            # Screen saver has overwritten display, so repaint everything
+            if self._saver >= SAVER_TIME:
+                for d in owner.display:
+                    d.force_all()
+
             self._saver = 0
 
     async def _screen_saver(self):
         for d in self.display:
             d.reset(0)
 
+        rng = self.rng
         while self._saver >= SAVER_TIME:
-            d = self.display[getrandbits(1)]
-            p = getrandbits(3), getrandbits(3)
+            d = self.display[rng.getrandbits(1)]
+            w, h = d.size
+            p = rng.getrandbits(8) % w, rng.getrandbits(8) % h
             d[p] = 1
-            await sleep_ms(200 + getrandbits(7))
-            display.show(*self.display)
+            await sleep_ms(200 + rng.getrandbits(7))
+            self._post(self.display)
             d[p] = 0
+
+    @core_task
+    async def _fader(self):
+        """Coroutine task running brightness effects of all owners on one timer"""
+        effects = self._effects
+        while True:
+            if not effects:
+                self._effect.clear()
+                await self._effect.wait()
+
+            now = ticks_ms()
+            for owner in list(effects):
+                e = effects[owner]
+                t = ticks_diff(now, e[1])
+                if t >= e[2]:
+                    del effects[owner]
+                    self.brightness(owner, e[4])
+                else:
+                    self.brightness(owner, self._level(e, t))
+
+            await sleep_ms(_FADE_TICK)
+
+    @staticmethod
+    def _level(e: list, t: int) -> int:
+        """Brightness of running effect
+
+        :param e:   Effect (curve, start, duration, initial value, final value, pulses)
+        :param t:   Time elapsed from start of effect in milliseconds
+
+        :return:    Brightness value (0 - 15)
+        """
+        curve, _, d, v0, v1, pulses = e
+
+        if curve == _FADE_PULSE:
+            if t >= pulses * _PULSE:
+                # Pulses are done - fade to final brightness
+                return v1 * (t - pulses * _PULSE) // _PULSE_RAMP
+            t %= _PULSE
+            if t < _PULSE_RAMP:
+                return 15 * t // _PULSE_RAMP
+            if t < _PULSE_RAMP + _PULSE_HOLD:
+                return 15
+            return 15 - 15 * (t - _PULSE_RAMP - _PULSE_HOLD) // _PULSE_RAMP
+
+        if curve == FADE_GAMMA:
+            return v0 + (v1 - v0) * t * t // (d * d)
+
+        return v0 + (v1 - v0) * t // d
+
+    def _post(self, buffs: tuple) -> None:
+        """Post frame to be shown by flush task
+
+        :param buffs:   Frame buffers (one for each display module)
+        """
+        self._frame = buffs
+        self._ready.set()
+
+    @core_task
+    async def _flush(self):
+        """Coroutine task showing latest posted frame"""
+        ready = self._ready
+        while True:
+            await ready.wait()
+            ready.clear()
+
+            t = ticks_ms()
+            buffs = self._frame
+            self._frame = None
+            if buffs is not None:
+                display.show(buffs)
+
+            await sleep_ms(max(0, DISPLAY_PERIOD - ticks_diff(ticks_ms(), t)))
@@ -1,12 +1,21 @@
 # MIT license; Copyright (c) 2023 Ondrej Sienczak
 from .task import Task
-from common import MatrixSand
+from common import MatrixSand, MatrixBitSand
 from common.atools import core_task
-from common.vect3d import dominates
-from uasyncio import sleep_ms, create_task
+from common.vect3d import dominant_hyst
+from common.heapmon import heapmon
+from common.pacer import FramePacer
+from uasyncio import create_task
 from utime import ticks_ms
-from gc import collect
-from config import CLOCK_TIME, BRIGHTNESS
+from drv import display
+from micropython import const
+from config import CLOCK_TIME, BRIGHTNESS, ACC_HYSTERESIS
+
+
+# Sample rate of accelerometer while sand is moving and time in milliseconds
+# for which it is kept after sand stops
+_RATE = const(100)
+_RATE_HOLD = const(2000)
 
 
 class HourGlass(Task):
@@ -15,20 +24,28 @@ class HourGlass(Task):
     def __init__(self):
         super().__init__("hourglass")
         print("Hourglass v1.3 by OSi")
-        self.neck_delay = 468.75  # 15.625 * 30 => 30s
-        self.anim_delay = 10
-        self.pulsing = 0
-        self.display = MatrixSand(), MatrixSand()
+        w, h = display.size(0)
+        self.grains = w * h
+        self.neck = (w - 1, 0), (0, h - 1)
+        # Neck delay per grain is 30s in total (integer avoids float allocations)
+        self.neck_delay = round(30000 / self.grains)
+        self.pacer = FramePacer(10, 200)
+
+        # Row based sand fits to 8x8 modules only, larger tiles uses generic sand
+        if w == 8 and h == 8:
+            self.display = MatrixBitSand(), MatrixBitSand()
+        else:
+            self.display = MatrixSand(w, h), MatrixSand(w, h)
         self.clock_delay = CLOCK_TIME * 1000
 
     @property
     def final_time(self) -> float:
         """Property used to get or set final hourglass time in seconds"""
-        return self.neck_delay / 15.625
+        return self.neck_delay * self.grains / 1000
 
     @final_time.setter
     def final_time(self, value: float) -> None:
-        self.neck_delay = value * 15.625
+        self.neck_delay = round(value * 1000 / self.grains)
 
     def reset(self):
         """Reset hourglass to initial state (sand in top side)"""
@@ -37,14 +54,20 @@ class HourGlass(Task):
 
     @core_task
     async def __call__(self):
-        """Main coroutine task handling sand animation"""
-        neck = (7, 0), (0, 7)
+        """Main coroutine task handling sand animation
+
+        Animation loop works with preallocated objects only, so no heap is allocated
+        per frame (can be checked by ``HEAP_DEBUG`` option in ``config.py``).
+        """
+        neck = self.neck
+        full = self.grains
 
         # Draw initial sand
         self.reset()
 
         # Activates gestures handling
         create_task(self._gestures())
+        create_task(self._wake())
 
         # Start animation in main task
         tnext = ticks_ms()
@@ -54,45 +77,56 @@ class HourGlass(Task):
         clock = self.tasks["clock"]
         dispman = self.tasks["dispman"]
         dispman.brightness(self, BRIGHTNESS)
+        g_45 = accel.grav45
+        g_3d = accel.gravity
+        tfast = 0
+        fast = False
+        d = 0
         while True:
+            if heapmon:
+                mark = heapmon.mark()
+
             # Animate gravity
-            g_45 = accel.grav45
+            animated = False
             for s in self.display:
-                if s.iterate(*g_45):
+                if s.iterate(g_45[0], g_45[1]):
                     dispman.keep_alive(self)
+                    animated = True
 
-            # Checks if we want launch _pulse
+            # Pulse when all sand has fallen
             l = len(s)
             if l != last_len:
-                if l == 0 or l == 64:
-                    if self.pulsing == 0:
-                        create_task(self._pulse())
-                    self.pulsing = min(2, self.pulsing + 1)
+                if l == 0 or l == full:
+                    dispman.pulse(self, 4, BRIGHTNESS)
                 last_len = l
 
             # Process hourglass neck throughput
-            g_3d = accel.gravity
             ts = ticks_ms()
 
             # Only when hourglass are not tilted more than 45 degrees
-            d, s = dominates(g_3d)
-            if d == 2:
+            d = dominant_hyst(g_3d, d, ACC_HYSTERESIS)
+            if d == 3 or d == -3:
                 # Check if there is time for next sand particle
                 tclock = ts + self.clock_delay
                 if ts > tnext:
                     tnext += self.neck_delay
-                    su, sl, nu, nl = (
-                        (self.display[1], self.display[0], neck[1], neck[0])
-                        if g_3d[2] > 0
-                        else (self.display[0], self.display[1], neck[0], neck[1])
-                    )
-                    if su[nu][0] and not sl[nl][0]:
+                    u = 1 if g_3d[2] > 0 else 0
+                    su, sl = self.display[u], self.display[1 - u]
+                    nu, nl = neck[u], neck[1 - u]
+                    if su.pixels.pixel(nu[0], nu[1]) and not sl.pixels.pixel(
+                        nl[0], nl[1]
+                    ):
                         su[nu] = 0
                         sl[nl] = 1
+                        animated = True
+
+                # Next sand particle wakes animation up
+                deadline = tnext + 1
             else:
                 # No sand is falling - postpone next sand particle for later
                 tnext = ts + self.neck_delay
-                if d == 0 and s < 0 and dispman.owner is not clock:
+                deadline = None
+                if d == -1 and dispman.owner is not clock:
                     # When clocks are on right side for a while, show current time
                     if ts > tclock:
                         clock.redraw()
@@ -100,10 +134,31 @@ class HourGlass(Task):
                 else:
                     tclock = ts + self.clock_delay
 
+            # Sample gravity faster while sand moves
+            if animated:
+                tfast = ts + _RATE_HOLD
+            if fast != (ts < tfast):
+                fast = not fast
+                accel.rate(self, _RATE if fast else 0)
+
             # Show result and wait next frame
             dispman.draw(self)
-            collect()
-            await sleep_ms(self.anim_delay)
+
+            if heapmon:
+                heapmon.account("hourglass", mark)
+
+            await self.pacer.frame(animated, deadline)
+
+    @core_task
+    async def _wake(self):
+        """Coroutine task waking up animation when gravity direction changes"""
+        last = -1
+        async for _ in self.tasks["accel"].register():
+            g_45 = self.tasks["accel"].grav45
+            d = MatrixBitSand._direction(g_45[0], g_45[1])
+            if d != last:
+                last = d
+                self.pacer.wake()
 
     @core_task
     async def _gestures(self):
@@ -113,25 +168,3 @@ class HourGlass(Task):
             setup = self.tasks["setup"]
             dispman.owner = setup
             create_task(setup.setup())
-
-    async def _pulse(self):
-        """Proceed pulsing of LEDs when clock is over"""
-        dispman = self.tasks["dispman"]
-        for _ in range(4):
-            for i in range(16):
-                dispman.brightness(self, i)
-                await sleep_ms(20 - i)
-
-            await sleep_ms(100)
-
-            for i in reversed(range(16)):
-                dispman.brightness(self, i)
-                await sleep_ms(20 - i)
-
-        for i in range(BRIGHTNESS + 1):
-            dispman.brightness(self, i)
-            await sleep_ms(20 - i)
-
-        self.pulsing -= 1
-        if self.pulsing > 0:
-            create_task(self._pulse())
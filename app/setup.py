@@ -1,15 +1,17 @@
 # MIT license; Copyright (c) 2023 Ondrej Sienczak
 from .task import Task
-from common.matrixbuffer import MatrixBuffer
+from common.zoombuffer import ZoomBuffer
 from common.glyphs import glyphs_setup
-from uasyncio import sleep_ms, create_task
+from common.anim import Transition
+from drv import display
 
 
 class Setup(Task):
     def __init__(self):
         super().__init__("setup")
-        self.display = MatrixBuffer(), MatrixBuffer()
+        self.display = ZoomBuffer(*display.size(0)), ZoomBuffer(*display.size(1))
         self.anim_delay = 10
+        self.anims = Transition(), Transition()
         self.last = 30, "s"
         self.brightness = 2
 
@@ -55,8 +57,9 @@ class Setup(Task):
 
             if g == "E":
                 l = len(hourglass.display[0])
-                if l != 0 and l != 64:
-                    create_task(self._clock_reset(dispman, hourglass))
+                if l != 0 and l != hourglass.grains:
+                    hourglass.reset()
+                    dispman.pulse(self, 2, self.brightness)
                 continue
 
             final_time = round(hourglass.final_time)
@@ -80,45 +83,18 @@ class Setup(Task):
         dispman.brightness(self, self.brightness)
 
         if vn != vo or sn != so:
-            r = range(8)
-            if reverse:
-                r = reversed(r)
-                vo, vn = vn, vo
-                so, sn = sn, so
-
-            for i in r:
-                if vn != vo:
-                    display[0].blit(glyphs_setup[vo], i, -i)
-                    display[0].blit(glyphs_setup[vn], i - 7, -i + 7)
-
-                if sn != so:
-                    display[1].blit(glyphs_setup[so], i, -i)
-                    display[1].blit(glyphs_setup[sn], i - 7, -i + 7)
-
-                dispman.draw(self)
-
-                await sleep_ms(self.anim_delay)
+            glyphs = glyphs_setup.rows
+            a0, a1 = self.anims
+            await dispman.play(
+                self,
+                (
+                    a0.slide(glyphs(vo), glyphs(vn), reverse) if vn != vo else None,
+                    a1.slide(glyphs(so), glyphs(sn), reverse) if sn != so else None,
+                ),
+                self.anim_delay,
+            )
         else:
             # No change - no animation - just draw current state
-            display[0].blit(glyphs_setup[vn], 0, 0)
-            display[1].blit(glyphs_setup[sn], 0, 0)
+            display[0].load(glyphs_setup.rows(vn))
+            display[1].load(glyphs_setup.rows(sn))
             dispman.draw(self)
-
-    async def _clock_reset(self, dispman, hourglass):
-        hourglass.reset()
-        dispman = self.tasks["dispman"]
-
-        for _ in range(2):
-            for i in range(16):
-                dispman.brightness(self, i)
-                await sleep_ms(20 - i)
-
-            sleep_ms(100)
-
-            for i in reversed(range(16)):
-                dispman.brightness(self, i)
-                await sleep_ms(20 - i)
-
-        for i in range(self.brightness + 1):
-            dispman.brightness(self, i)
-            await sleep_ms(20 - i)
@@ -0,0 +1,29 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+"""Headless benchmarks of frame cost.
+
+Benchmarks run on host without pygame (emulated display is not drawn) and
+they report results as JSON, so results can be compared between releases.
+Run them from repository root::
+
+    python3 -m bench -o bench.json
+
+Recorded accelerometer samples (see ``ACC_RECORD``) can be replayed too::
+
+    python3 -m bench -r acc.rec -s 4
+"""
+from time import perf_counter
+
+
+def rate(fn, count: int) -> float:
+    """Measure how many times per second can be function called.
+
+    :param fn:       Function to be called (without arguments)
+    :param count:    Count of calls
+
+    :return:    Calls per second
+    """
+    t = perf_counter()
+    for _ in range(count):
+        fn()
+    t = perf_counter() - t
+    return count / t if t > 0 else float("inf")
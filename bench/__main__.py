@@ -0,0 +1,35 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+from . import sand, buffer, display
+from argparse import ArgumentParser
+from json import dumps
+
+
+def main():
+    parser = ArgumentParser(description="Headless hourglass benchmarks")
+    parser.add_argument("-n", "--count", type=int, default=200, help="iterations")
+    parser.add_argument("-o", "--output", help="output file (stdout by default)")
+    parser.add_argument("-r", "--replay", help="replay recorded accelerometer samples")
+    parser.add_argument("-s", "--speed", type=float, default=4, help="replay speed")
+    args = parser.parse_args()
+
+    results = {
+        "sand": sand.run(args.count),
+        "buffer": buffer.run(args.count),
+        "display": display.run(args.count),
+    }
+
+    if args.replay:
+        # Replay loads accelerometer driver, so it is imported only when needed
+        from . import replay
+
+        results["replay"] = replay.run(args.replay, args.speed)
+
+    out = dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(out + "\n")
+    else:
+        print(out)
+
+
+main()
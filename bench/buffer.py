@@ -0,0 +1,32 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+from . import rate
+from itertools import cycle
+from common import MatrixBuffer
+from common.clockface import ClockFace
+from common.glyphs import glyphs_clock
+
+
+def run(count: int) -> dict:
+    """Measure throughput of frame buffer operations.
+
+    :param count:    Count of calls per measurement
+
+    :return:    Calls per second of each operation
+    """
+    buf = MatrixBuffer()
+    glyph = glyphs_clock[8]
+    face = ClockFace()
+    faces = cycle((face.minutes(38), face.minutes(39)))
+
+    def copy():
+        buf.make_copy()
+        buf.use_copy()
+
+    return {
+        "make_copy": round(rate(buf.make_copy, count), 1),
+        "make_copy+use_copy": round(rate(copy, count), 1),
+        "edit": round(rate(buf.edit, count), 1),
+        "blit": round(rate(lambda: buf.blit(glyph, 0, 0), count), 1),
+        "blit_key": round(rate(lambda: buf.blit(glyph, 0, 0, 0), count), 1),
+        "load": round(rate(lambda: buf.load(next(faces)), count), 1),
+    }
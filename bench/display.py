@@ -0,0 +1,42 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+from .spi import CountingSPI
+from .sand import fill
+from common import MatrixBitSand
+from common.xorshift import XorShift
+from drv.max7219 import Matrix8x8
+from time import perf_counter
+
+
+def run(frames: int) -> dict:
+    """Measure SPI traffic of display driver.
+
+    Both chambers are animated by falling sand (one chamber full, second empty,
+    both flipped up side down every 64 frames) and displayed every frame.
+
+    :param frames:    Count of frames
+
+    :return:    SPI calls and bytes per frame and time spent in ``show``
+    """
+    spi = CountingSPI()
+    display = Matrix8x8(spi, 15, 2)
+    rng = XorShift(1)
+    sand = MatrixBitSand(rng), MatrixBitSand(rng)
+    fill(sand[0], 32, rng)
+    fill(sand[1], 32, rng)
+    spi.clear()
+
+    spent = 0
+    for frame in range(frames):
+        g = 1000 if frame & 64 else -1000
+        for s in sand:
+            s.iterate(g, g)
+
+        t = perf_counter()
+        display.show(sand)
+        spent += perf_counter() - t
+
+    return {
+        "calls_per_frame": spi.calls / frames,
+        "bytes_per_frame": spi.bytes / frames,
+        "show_per_sec": round(frames / spent, 1),
+    }
@@ -0,0 +1,88 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+from common import MatrixBitSand
+from common.accring import AccelRing
+from common.gestures import GestureDecoder
+from common.xorshift import XorShift
+from drv.adxl345 import Adxl345
+from machine import ReplayI2C
+from utime import ticks_ms
+from config import ACC_TRANSFORM, ACC_FILTER, ACC_LOW_RATE
+from .sand import fill
+from time import perf_counter, process_time
+import asyncio
+
+
+# Samples collected per poll and longest poll period [ms] (as accelerometer task)
+_BATCH = 8
+_POLL_MAX = 100
+
+
+def run(path: str, speed: float) -> dict:
+    """Replay recorded motion through accelerometer, gestures and sand.
+
+    Recorded samples are fed to accelerometer driver by replaying I2C bus and
+    processed by the same ring of samples as accelerometer task uses. Gestures
+    are recognized by gesture decoder and both sand chambers are animated by
+    each sample. No application task is created.
+
+    :param path:     Record file (see ``ACC_RECORD``)
+    :param speed:    Replay speed
+
+    :return:    Samples replayed, gestures recognized, sand steps and CPU time
+                spent per sample
+    """
+    i2c = ReplayI2C(path=path, speed=speed)
+    accel = Adxl345(i2c)
+    samples = AccelRing(ACC_TRANSFORM, ACC_FILTER)
+    rng = XorShift(1)
+    sand = MatrixBitSand(rng), MatrixBitSand(rng)
+    fill(sand[0], 32, rng)
+    fill(sand[1], 32, rng)
+
+    counts = dict()
+    count = animated = 0
+    hz = ACC_LOW_RATE
+
+    def notify(g: str) -> None:
+        counts[g] = counts.get(g, 0) + 1
+
+    def rate(want: int) -> None:
+        nonlocal hz
+        hz = want or ACC_LOW_RATE
+
+    decoder = GestureDecoder(notify, lambda: None, rate)
+
+    async def animate():
+        nonlocal count, animated
+        async for g in samples.register():
+            count += 1
+            for s in sand:
+                animated += s.iterate(-g[2] - g[0], -g[0] + g[2])
+
+    async def main():
+        tasks = [asyncio.create_task(decoder(samples.register()))]
+        tasks.append(asyncio.create_task(animate()))
+        applied = 0
+
+        while not i2c.done:
+            samples.push(accel, accel.drain(), ticks_ms())
+            if applied != hz:
+                applied = hz
+                accel.rate(hz)
+            await asyncio.sleep(min(accel.period * _BATCH, _POLL_MAX) / 1000)
+
+        await asyncio.sleep(0)
+        for t in tasks:
+            t.cancel()
+
+    t, cpu = perf_counter(), process_time()
+    asyncio.run(main())
+    t, cpu = perf_counter() - t, process_time() - cpu
+
+    return {
+        "samples": count,
+        "gestures": counts,
+        "animated": animated,
+        "replay_sec": round(t, 2),
+        "cpu_us_per_sample": round(cpu * 1e6 / count, 1) if count else None,
+    }
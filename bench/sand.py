@@ -0,0 +1,96 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+from common import MatrixSand, MatrixBitSand
+from common.matrixsand import SAND_SERIAL, SAND_MARGOLUS
+from common.sandtables import UNITS
+from common.xorshift import XorShift
+from time import perf_counter
+
+
+ENGINES = {
+    "serial": lambda rng: MatrixSand(rule=SAND_SERIAL, rng=rng),
+    "margolus": lambda rng: MatrixSand(rule=SAND_MARGOLUS, rng=rng),
+    "bits": lambda rng: MatrixBitSand(rng=rng),
+}
+
+FILLS = 0, 8, 16, 24, 32, 40, 48, 56, 64
+
+
+def fill(sand: MatrixSand, grains: int, rng: XorShift) -> None:
+    """Fill sand with grains on random positions.
+
+    :param sand:      Sand to be filled
+    :param grains:    Count of grains
+    :param rng:       Random generator
+    """
+    sand.reset(False)
+    while len(sand) < grains:
+        sand[rng.getrandbits(3), rng.getrandbits(3)] = 1
+
+
+def measure(sand: MatrixSand, grains: int, ax: int, ay: int, steps: int, rng) -> dict:
+    """Measure animated sand steps.
+
+    Only steps which moves some grain are timed. Settled sand returns from step
+    early, so whenever sand settles it is refilled with new random grains
+    (not timed). Measurement ends after given count of animated steps or when
+    sand does not move even after refill (empty or full matrix).
+
+    :param sand:      Sand engine
+    :param grains:    Count of grains
+    :param ax:        X acceleration
+    :param ay:        Y acceleration
+    :param steps:     Count of animated steps to be measured
+    :param rng:       Random generator
+
+    :return:    Animated steps per second and count of animated steps
+    """
+    animated = 0
+    spent = 0.0
+    fills = 0
+
+    while animated < steps and fills < steps:
+        fill(sand, grains, rng)
+        fills += 1
+
+        while animated < steps:
+            t = perf_counter()
+            moved = sand.iterate(ax, ay)
+            t = perf_counter() - t
+            if not moved:
+                break
+            spent += t
+            animated += 1
+            fills = 0
+
+    return {
+        "steps_per_sec": round(animated / spent, 1) if spent > 0 else None,
+        "animated": animated,
+    }
+
+
+def run(steps: int) -> dict:
+    """Measure sand animation steps per second.
+
+    Each measurement starts from random grains, and it is refilled whenever
+    sand settles, so only steps moving grains are measured (see `measure`).
+
+    :param steps:    Count of animated steps per measurement
+
+    :return:    Animated steps per second for each engine, fill level and direction
+    """
+    results = dict()
+
+    for name, engine in ENGINES.items():
+        rng = XorShift(1)
+        sand = engine(rng)
+        results[name] = by_fill = dict()
+
+        for grains in FILLS:
+            by_fill[grains] = by_dir = dict()
+
+            for ix, iy in UNITS:
+                by_dir[f"{ix},{iy}"] = measure(
+                    sand, grains, ix * 1000, iy * 1000, steps, rng
+                )
+
+    return results
@@ -0,0 +1,15 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+class CountingSPI:
+    """SPI bus counting transfers instead of sending them."""
+
+    def __init__(self):
+        self.calls = 0
+        self.bytes = 0
+
+    def write(self, data: bytes) -> None:
+        self.calls += 1
+        self.bytes += len(data)
+
+    def clear(self) -> None:
+        self.calls = 0
+        self.bytes = 0
@@ -1,3 +1,4 @@
 # MIT license; Copyright (c) 2023 Ondrej Sienczak
 from .matrixbuffer import MatrixBuffer
 from .matrixsand import MatrixSand
+from .matrixbitsand import MatrixBitSand
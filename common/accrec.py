@@ -0,0 +1,103 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+from struct import pack_into, unpack_from
+from micropython import const
+
+
+# Batch header - time of last sample [ms], count of samples and sample period [ms]
+_HEAD = "<IBB"
+_HEAD_SIZE = const(6)
+
+# Count of batches after which records are flushed to file
+_FLUSH = const(16)
+
+
+class AccRecorder:
+    """Recorder of raw accelerometer samples.
+
+    Samples are recorded in batches as they are read from accelerometer FIFO.
+    Each batch is stored as 6 bytes header (see ``_HEAD``) followed by raw
+    samples (6 bytes per sample as read from data registers), so record is
+    compact enough to be stored in device file system. Records can be replayed
+    in emulation by ``ReplayI2C``.
+
+    Recording stops when record reaches its maximal size or when file can not
+    be written (e.g. file system is full), so recording never breaks the task
+    reading accelerometer.
+
+    :param path:    Record file
+    :param size:    Maximal size of record [B]
+    """
+
+    def __init__(self, path: str, size: int):
+        self._file = open(path, "wb")
+        self._head = bytearray(_HEAD_SIZE)
+        self._batches = 0
+        self._left = size
+        self._views = None
+
+    def write(self, t: int, period: int, samples: bytearray, n: int) -> bool:
+        """Record batch of samples.
+
+        :param t:          Time of last sample [ms]
+        :param period:     Sample period [ms]
+        :param samples:    Raw samples
+        :param n:          Count of samples
+
+        :return:    ``False`` when recording has been stopped
+        """
+        if self._file is None:
+            return False
+
+        # Views of samples are prepared once for each count of samples (driver
+        # reads samples always to the same preallocated buffer)
+        if self._views is None:
+            view = memoryview(samples)
+            self._views = tuple([view[: i * 6] for i in range(len(samples) // 6 + 1)])
+
+        self._left -= _HEAD_SIZE + n * 6
+        if self._left < 0:
+            print("Accelerometer record is full")
+            self.close()
+            return False
+
+        try:
+            pack_into(_HEAD, self._head, 0, t, n, period)
+            self._file.write(self._head)
+            self._file.write(self._views[n])
+
+            self._batches += 1
+            if self._batches % _FLUSH == 0:
+                self._file.flush()
+        except OSError as e:
+            print("Accelerometer recording failed:", e)
+            self.close()
+            return False
+
+        return True
+
+    def close(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+
+def batches(path: str):
+    """Read batches of recorded samples.
+
+    :param path:    Record file
+
+    :return:    Iterator of tuples containing time of last sample, sample period
+                and raw samples of each batch
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    o = 0
+    while o + _HEAD_SIZE <= len(data):
+        t, n, period = unpack_from(_HEAD, data, o)
+        o += _HEAD_SIZE
+        yield t, period, data[o : o + n * 6]
+        o += n * 6
@@ -0,0 +1,152 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+from uasyncio import Event
+from utime import ticks_ms, ticks_add, ticks_diff
+from micropython import const
+
+
+_RING = const(32)  # Must be power of 2
+_HEAD_MASK = const(0xFFFFFF)
+
+
+class AccelSync:
+    """Iterator over gravity samples.
+
+    Each sample is delivered to each listener once, so listener sees all samples
+    read from accelerometer FIFO. When listener is lagging more than ring of
+    samples holds, then oldest samples are skipped.
+
+    :param accel:    Ring of samples
+    """
+
+    def __init__(self, accel):
+        self.event = Event()
+        self.accel = accel
+        self.time = 0
+        self._next = accel.head
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        accel = self.accel
+        lag = (accel.head - self._next) & _HEAD_MASK
+
+        if not lag:
+            self.event.clear()
+            await self.event.wait()
+            lag = (accel.head - self._next) & _HEAD_MASK
+
+        if lag > _RING:
+            self._next = (accel.head - _RING) & _HEAD_MASK
+
+        i = self._next & (_RING - 1)
+        self._next = (self._next + 1) & _HEAD_MASK
+        self.time = accel.times[i]
+        return accel.ring[i]
+
+    def window(self, ms: int) -> "_Window":
+        """Iterate over samples taken in time window only.
+
+        :param ms:    Window length [ms] starting by last sample
+
+        :return:    Iterator ending with first sample taken after window
+        """
+        return _Window(self, ms)
+
+
+class _Window:
+    def __init__(self, sync: AccelSync, ms: int):
+        self._sync = sync
+        self._end = ticks_add(sync.time, ms)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        gravity = await self._sync.__anext__()
+        if ticks_diff(self._sync.time, self._end) > 0:
+            raise StopAsyncIteration
+        return gravity
+
+
+class AccelRing:
+    """Ring of processed accelerometer samples.
+
+    Each sample read from FIFO is transformed to clock position by compiled
+    axes permutation and signs, then filtered by integer IIR low-pass filter
+    and stored to ring of samples. All is done in place in preallocated
+    arrays, so no heap is allocated per sample.
+
+    :param transform:    Axes positions and signs (see ``ACC_TRANSFORM``)
+    :param shift:        Low-pass filter shift (see ``ACC_FILTER``)
+    """
+
+    def __init__(self, transform: tuple, shift: int):
+        # Vectors are updated in place, so they can be referenced by other tasks
+        self.gravity = [0, 0, 0]
+        self.grav45 = [0, 0]
+        self.listeners = list()
+        self.transform = bytes([abs(i) - 1 for i in transform]), tuple(
+            [1 if i > 0 else -1 for i in transform]
+        )
+        self.shift = shift
+        self.ring = tuple([[0, 0, 0] for _ in range(_RING)])
+        self.times = [0] * _RING
+        self.head = 0
+        self._raw = [0, 0, 0]
+        self._last = ticks_ms()
+
+    def push(self, accel, n: int, now: int) -> None:
+        """Process batch of samples and wake up listeners.
+
+        :param accel:    Accelerometer driver holding samples read by ``drain``
+        :param n:        Count of samples
+        :param now:      Time when samples has been read [ms]
+        """
+        if not n:
+            return
+
+        (t0, t1, t2), (s0, s1, s2) = self.transform
+        k = self.shift
+        raw = self._raw
+        g = self.gravity
+        ring = self.ring
+        times = self.times
+        period = accel.period
+
+        # Samples never go back in time (FIFO may still contain samples taken
+        # at previous rate or replayed faster than real time)
+        t = ticks_add(now, (1 - n) * period)
+        if ticks_diff(t, self._last) <= 0:
+            t = ticks_add(self._last, period)
+
+        for i in range(n):
+            accel.sample_into(i, raw)
+            j = self.head & (_RING - 1)
+            g[0] += (raw[t0] * s0 - g[0]) >> k
+            g[1] += (raw[t1] * s1 - g[1]) >> k
+            g[2] += (raw[t2] * s2 - g[2]) >> k
+            s = ring[j]
+            s[0] = g[0]
+            s[1] = g[1]
+            s[2] = g[2]
+            times[j] = t
+            t = ticks_add(t, period)
+            self.head = (self.head + 1) & _HEAD_MASK
+
+        self._last = times[j]
+        g45 = self.grav45
+        g45[0] = -g[2] - g[0]
+        g45[1] = -g[0] + g[2]
+
+        for event in self.listeners:
+            event.event.set()
+
+    def register(self) -> AccelSync:
+        """Register listener of samples.
+
+        :return:    Iterator over samples
+        """
+        event = AccelSync(self)
+        self.listeners.append(event)
+        return event
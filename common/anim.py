@@ -0,0 +1,123 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+from micropython import const
+
+
+FRAMES = const(8)
+
+
+def _bayer(x: int, y: int) -> int:
+    """Threshold of ordered dithering 8x8 matrix (0 - 63)."""
+    v = 0
+    for bit in range(3):
+        v = (v << 2) | (((x ^ y) >> bit) & 1) << 1 | ((y >> bit) & 1)
+    return v
+
+
+# Masks of pixels already switched to new glyph in each frame of fade
+_DITHER = bytearray(
+    sum(0x80 >> x for x in range(8) if _bayer(x, y) < (f + 1) * 64 // FRAMES)
+    for f in range(FRAMES)
+    for y in range(8)
+)
+
+
+class Transition:
+    """Precomputed transition between two 8x8 bitmaps.
+
+    Frames of transition are composed in advance into one preallocated array
+    (8 rows per frame), so they can be just loaded into display buffer during
+    playback (see :meth:`DispMan.play`). Transition object can be reused for
+    next transition without any allocation.
+    """
+
+    def __init__(self):
+        self._frames = bytearray(8 * FRAMES)
+        self._view = memoryview(self._frames)
+
+    def frame(self, i: int) -> memoryview:
+        """Get frame of transition.
+
+        :param i:    Frame index (0 - FRAMES - 1)
+
+        :return:    Frame rows
+        """
+        o = i * 8
+        return self._view[o : o + 8]
+
+    def slide(self, old: bytes, new: bytes, reverse: bool = False) -> "Transition":
+        """Compose diagonal slide.
+
+        Old bitmap slides out to top right corner while new one comes from bottom
+        left corner, or the other way around when reversed.
+
+        :param old:        Rows of old bitmap
+        :param new:        Rows of new bitmap
+        :param reverse:    Slide in opposite direction
+
+        :return:    Self
+        """
+        f = self._frames
+        f[0:8] = old
+
+        if reverse:
+            old, new = new, old
+
+        for n in range(FRAMES):
+            i = FRAMES - 1 - n if reverse else n
+            o = n * 8
+            if n:
+                f[o : o + 8] = self.frame(n - 1)
+            self._put(o, old, i, -i)
+            self._put(o, new, i - 7, 7 - i)
+
+        return self
+
+    def wipe(self, old: bytes, new: bytes, reverse: bool = False) -> "Transition":
+        """Compose wipe replacing old bitmap by new one row by row.
+
+        :param old:        Rows of old bitmap
+        :param new:        Rows of new bitmap
+        :param reverse:    Wipe from bottom to top
+
+        :return:    Self
+        """
+        f = self._frames
+        for n in range(FRAMES):
+            edge = (n + 1) * 8 // FRAMES
+            for y in range(8):
+                shown = (7 - y if reverse else y) < edge
+                f[n * 8 + y] = new[y] if shown else old[y]
+        return self
+
+    def fade(self, old: bytes, new: bytes) -> "Transition":
+        """Compose dissolve of old bitmap into new one (ordered dithering).
+
+        :param old:    Rows of old bitmap
+        :param new:    Rows of new bitmap
+
+        :return:    Self
+        """
+        f = self._frames
+        for i in range(8 * FRAMES):
+            y = i & 7
+            m = _DITHER[i]
+            f[i] = (old[y] & ~m) | (new[y] & m)
+        return self
+
+    def _put(self, o: int, src: bytes, x: int, y: int) -> None:
+        """Paint 8x8 bitmap over frame (same as ``blit`` without transparency).
+
+        :param o:      Offset of frame
+        :param src:    Rows of bitmap
+        :param x:      X coordinate (origin) of bitmap
+        :param y:      Y coordinate (origin) of bitmap
+        """
+        f = self._frames
+        if x >= 0:
+            m = 0xFF >> x
+        else:
+            m = (0xFF << -x) & 0xFF
+
+        for sy in range(max(0, -y), min(8, 8 - y)):
+            s = src[sy] >> x if x >= 0 else (src[sy] << -x) & 0xFF
+            f[o + y + sy] = (f[o + y + sy] & ~m) | s
@@ -0,0 +1,51 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+from .glyphs import glyphs_clock
+
+
+class ClockFace:
+    """Cache of composed clock face bitmaps.
+
+    Each bitmap of hours (0 - 23) and minutes (0 - 59) is composed from rows
+    of units and tens glyphs when used for the first time. Then it is just
+    8 bytes in ``MONO_HLSB`` format ready to be loaded into display buffer
+    (see :meth:`MatrixBuffer.load`). Whole cache takes 672 bytes only, so
+    nothing has to be evicted.
+    """
+
+    def __init__(self):
+        self._faces = bytearray((24 + 60) * 8)
+        self._ready = bytearray(24 + 60)
+        self._view = memoryview(self._faces)
+
+    def hours(self, h: int) -> memoryview:
+        """Get hours bitmap.
+
+        :param h:    Hours (0 - 23)
+
+        :return:    Composed bitmap (8 rows)
+        """
+        return self._face(h, h > 9)
+
+    def minutes(self, m: int) -> memoryview:
+        """Get minutes bitmap (minutes lower than 10 has leading zero).
+
+        :param m:    Minutes (0 - 59)
+
+        :return:    Composed bitmap (8 rows)
+        """
+        return self._face(24 + m, True)
+
+    def _face(self, i: int, tens: bool) -> memoryview:
+        o = i * 8
+
+        if not self._ready[i]:
+            v = i if i < 24 else i - 24
+            f = self._faces
+            f[o : o + 8] = glyphs_clock.rows(v % 10)
+            if tens:
+                t = glyphs_clock.rows(v // 10 * 10 or 100)
+                for y in range(8):
+                    f[o + y] |= t[y]
+            self._ready[i] = 1
+
+        return self._view[o : o + 8]
@@ -0,0 +1,45 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+from framebuf import FrameBuffer, MONO_HLSB
+
+
+class Font:
+    """Font of 8x8 glyphs packed in read only blob.
+
+    Glyphs are stored in blob (8 rows in ``MONO_HLSB`` format per glyph) generated
+    by ``tools/mkglyphs.py``. Rows of glyphs are accessed by memoryview slices
+    without copying, frame buffers are materialized on demand only.
+
+    :param blob:     Glyphs rows
+    :param index:    Offsets of glyphs in blob
+    """
+
+    def __init__(self, blob: bytes, index: dict):
+        self._view = memoryview(blob)
+        self._index = index
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def __getitem__(self, key) -> FrameBuffer:
+        """Materialize glyph as frame buffer.
+
+        This allocates new frame buffer, so rather use :meth:`rows` when possible.
+
+        :param key:    Glyph key
+
+        :return:    Glyph frame buffer
+        """
+        return FrameBuffer(bytearray(self.rows(key)), 8, 8, MONO_HLSB)
+
+    def rows(self, key) -> memoryview:
+        """Get glyph rows (row by row in ``MONO_HLSB`` format).
+
+        :param key:    Glyph key
+
+        :return:    Glyph rows
+        """
+        o = self._index[key]
+        return self._view[o : o + 8]
+
+    def keys(self):
+        return self._index.keys()
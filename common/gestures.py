@@ -0,0 +1,111 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+from .vect3d import dominant_hyst
+from micropython import const
+from config import ACC_HYSTERESIS
+
+
+_DLY_MS = const(500)
+_RATE = const(200)
+
+
+class GestureDecoder:
+    """Decoder of gestures from stream of gravity samples.
+
+    Decoder recognizes gestures ``E`` (escape), ``U``/``D`` (up/down), ``L``/``R``
+    (left/right) and ``X`` (side y) and reports each change of dominant axis
+    as ``*``.
+
+    :param notify:        Called with recognized gesture
+    :param keep_alive:    Called when selection sequence continues
+    :param rate:          Called with sample rate needed (0 when no more needed)
+    """
+
+    def __init__(self, notify, keep_alive, rate):
+        self._notify = notify
+        self._keep_alive = keep_alive
+        self._rate = rate
+        self._acc = None
+        self._dominating = 0
+
+    async def __call__(self, acc) -> None:
+        """Decode gestures (never returns).
+
+        :param acc:    Iterator over gravity samples (see :class:`AccelSync`)
+        """
+        self._acc = acc
+
+        async for gravity in acc:
+            s = self._dominates(gravity)
+            d = abs(s) - 1
+
+            # Any selection sequence starts with display facing up (quick
+            # flips are sampled at higher rate)
+            if d == 1 and s > 0:
+                self._rate(_RATE)
+                await self._selection()
+                self._rate(0)
+
+    async def _selection(self):
+        # Stay checking if we are facing display up
+        self._keep_alive()
+
+        async for gravity in self._acc:
+            s = self._dominates(gravity)
+            d = abs(s) - 1
+
+            # Escape sequence starts with rotating on side
+            if d == 0:
+                # Check if there is escape sequence pattern or side x pattern
+                await self._side_x(s)
+
+                # Wait till returned out from rotated position
+                async for gravity in self._acc:
+                    if abs(self._dominates(gravity)) != 1:
+                        break
+
+            # Rotating on top or bottom - side y
+            elif d == 2:
+                side = s
+                self._keep_alive()
+                async for gravity in self._acc.window(_DLY_MS):
+                    s = self._dominates(gravity)
+                    d = abs(s) - 1
+
+                    # When quickly rotated back then it is gesture
+                    if d == 1:
+                        self._notify("U" if side > 0 else "D")
+                        break
+                else:
+                    self._notify("X")
+                    return
+
+    async def _side_x(self, side: int) -> None:
+        # We was tilted on side. Now check if are rotating from side to display up and back twice
+        # in defined interval to activate escape.
+        self._keep_alive()
+
+        for i in b"\x01\0\x01\0\x01":
+            async for gravity in self._acc.window(_DLY_MS):
+                s = self._dominates(gravity)
+                d = abs(s) - 1
+
+                if d == 2:
+                    return
+                elif d == i:
+                    if i == 1:
+                        self._notify("L" if side < 0 else "R")
+                    break
+                else:
+                    side = s
+            else:
+                return
+
+        self._notify("E")
+
+    def _dominates(self, gravity: list) -> int:
+        # Dominant axis (see dominant) - hysteresis suppresses jitter around 45 degrees
+        d = dominant_hyst(gravity, self._dominating, ACC_HYSTERESIS)
+        if self._dominating != d:
+            self._dominating = d
+            self._notify("*")
+        return d
@@ -1,51 +1,84 @@
 # MIT license; Copyright (c) 2023 Ondrej Sienczak
-from framebuf import FrameBuffer, MONO_HLSB
+#
+# Generated by tools/mkglyphs.py - do not edit.
+from .font import Font
 
-glyphs_setup = {
-    0: FrameBuffer(bytearray(b'\x00\x0c\x12"DH0\x00'), 8, 8, MONO_HLSB),
-    1: FrameBuffer(bytearray(b"\x00\x00\x04\x08\x108\x00\x00"), 8, 8, MONO_HLSB),
-    2: FrameBuffer(bytearray(b"\x00\x08\x04>@@0\x00"), 8, 8, MONO_HLSB),
-    3: FrameBuffer(bytearray(b"\x00\x0c\x122@@0\x00"), 8, 8, MONO_HLSB),
-    4: FrameBuffer(bytearray(b'\x00\x14\x08\x14"|\x00\x00'), 8, 8, MONO_HLSB),
-    5: FrameBuffer(bytearray(b"\x00\x0c\x12\x12\x10\x88P "), 8, 8, MONO_HLSB),
-    6: FrameBuffer(bytearray(b"\x00\x0c\x12\x12\x0cH0\x00"), 8, 8, MONO_HLSB),
-    7: FrameBuffer(bytearray(b"\x00\x00\x04\x08p\x80@ "), 8, 8, MONO_HLSB),
-    8: FrameBuffer(bytearray(b"\x00\x0c\x122LH0\x00"), 8, 8, MONO_HLSB),
-    9: FrameBuffer(bytearray(b"\x00\x0c\x120HH0\x00"), 8, 8, MONO_HLSB),
-    10: FrameBuffer(bytearray(b"0H\x88\x92d\x08\x1c\x00"), 8, 8, MONO_HLSB),
-    15: FrameBuffer(bytearray(b"0( \xa2D\x08\x1c\x00"), 8, 8, MONO_HLSB),
-    20: FrameBuffer(bytearray(b"0H\x8c\x92o\x10\x10\x08"), 8, 8, MONO_HLSB),
-    25: FrameBuffer(bytearray(b"0( \xa2A\x1e\x10\x08"), 8, 8, MONO_HLSB),
-    30: FrameBuffer(bytearray(b"0H\x88\x96i\x14\x10\x08"), 8, 8, MONO_HLSB),
-    35: FrameBuffer(bytearray(b"0( \xa6E\x1c\x10\x08"), 8, 8, MONO_HLSB),
-    40: FrameBuffer(bytearray(b"0H\x88\x92d\n\x1f\x00"), 8, 8, MONO_HLSB),
-    45: FrameBuffer(bytearray(b"0( \xa2D\n\x1f\x00"), 8, 8, MONO_HLSB),
-    50: FrameBuffer(bytearray(b"0H\x88\x96e\x04\x14\x08"), 8, 8, MONO_HLSB),
-    55: FrameBuffer(bytearray(b"0( \xa6E\x04\x14\x08"), 8, 8, MONO_HLSB),
-    60: FrameBuffer(bytearray(b"0H\x88\x96i\t\x1e\x00"), 8, 8, MONO_HLSB),
-    "m": FrameBuffer(bytearray(b"\x10 DH1\x12\x0c\x00"), 8, 8, MONO_HLSB),
-    "s": FrameBuffer(bytearray(b"\x00\x0c\n*(\x18\x00\x00"), 8, 8, MONO_HLSB),
-}
+GLYPHS = (
+    b"\x00\x0c\x12\x22\x44\x48\x30\x00\x00\x00\x04\x08\x10\x38\x00\x00"
+    b"\x00\x08\x04\x3e\x40\x40\x30\x00\x00\x0c\x12\x32\x40\x40\x30\x00"
+    b"\x00\x14\x08\x14\x22\x7c\x00\x00\x00\x0c\x12\x12\x10\x88\x50\x20"
+    b"\x00\x0c\x12\x12\x0c\x48\x30\x00\x00\x00\x04\x08\x70\x80\x40\x20"
+    b"\x00\x0c\x12\x32\x4c\x48\x30\x00\x00\x0c\x12\x30\x48\x48\x30\x00"
+    b"\x30\x48\x88\x92\x64\x08\x1c\x00\x30\x28\x20\xa2\x44\x08\x1c\x00"
+    b"\x30\x48\x8c\x92\x6f\x10\x10\x08\x30\x28\x20\xa2\x41\x1e\x10\x08"
+    b"\x30\x48\x88\x96\x69\x14\x10\x08\x30\x28\x20\xa6\x45\x1c\x10\x08"
+    b"\x30\x48\x88\x92\x64\x0a\x1f\x00\x30\x28\x20\xa2\x44\x0a\x1f\x00"
+    b"\x30\x48\x88\x96\x65\x04\x14\x08\x30\x28\x20\xa6\x45\x04\x14\x08"
+    b"\x30\x48\x88\x96\x69\x09\x1e\x00\x10\x20\x44\x48\x31\x12\x0c\x00"
+    b"\x00\x0c\x0a\x2a\x28\x18\x00\x00\x0c\x12\x11\x09\x06\x00\x00\x00"
+    b"\x08\x0c\x0a\x01\x00\x00\x00\x00\x0c\x14\x15\x06\x04\x00\x00\x00"
+    b"\x0c\x12\x15\x01\x06\x00\x00\x00\x08\x09\x0a\x05\x00\x00\x00\x00"
+    b"\x08\x10\x0f\x01\x02\x00\x00\x00\x10\x16\x19\x09\x06\x00\x00\x00"
+    b"\x04\x0a\x12\x02\x01\x00\x00\x00\x0c\x14\x1f\x05\x06\x00\x00\x00"
+    b"\x0c\x12\x13\x0d\x01\x00\x00\x00\x00\x00\x00\x40\x60\x50\x08\x00"
+    b"\x00\x00\x00\x60\xa0\xa8\x30\x20\x00\x00\x00\x60\x90\xa8\x08\x30"
+    b"\x00\x00\x00\x00\x80\x90\xa0\x50\x00\x00\x00\x40\x80\x78\x08\x10"
+    b"\x00\x00\x00\xe0\x30\x48\x48\x30\x00\x00\x00\x20\x50\x90\x10\x08"
+    b"\x00\x00\x00\x60\xa0\xf8\x28\x30\x00\x00\x00\x60\x90\x98\x68\x08"
+    b"\x00\x00\x00\x60\x90\x88\x48\x30"
+)
 
-glyphs_clock = {
-    0: FrameBuffer(bytearray(b"\x0c\x12\x11\t\x06\x00\x00\x00"), 8, 8, MONO_HLSB),
-    1: FrameBuffer(bytearray(b"\x08\x0c\n\x01\x00\x00\x00\x00"), 8, 8, MONO_HLSB),
-    2: FrameBuffer(bytearray(b"\x0c\x14\x15\x06\x04\x00\x00\x00"), 8, 8, MONO_HLSB),
-    3: FrameBuffer(bytearray(b"\x0c\x12\x15\x01\x06\x00\x00\x00"), 8, 8, MONO_HLSB),
-    4: FrameBuffer(bytearray(b"\x08\t\n\x05\x00\x00\x00\x00"), 8, 8, MONO_HLSB),
-    5: FrameBuffer(bytearray(b"\x08\x10\x0f\x01\x02\x00\x00\x00"), 8, 8, MONO_HLSB),
-    6: FrameBuffer(bytearray(b"\x10\x16\x19\t\x06\x00\x00\x00"), 8, 8, MONO_HLSB),
-    7: FrameBuffer(bytearray(b"\x04\n\x12\x02\x01\x00\x00\x00"), 8, 8, MONO_HLSB),
-    8: FrameBuffer(bytearray(b"\x0c\x14\x1f\x05\x06\x00\x00\x00"), 8, 8, MONO_HLSB),
-    9: FrameBuffer(bytearray(b"\x0c\x12\x13\r\x01\x00\x00\x00"), 8, 8, MONO_HLSB),
-    10: FrameBuffer(bytearray(b"\x00\x00\x00@`P\x08\x00"), 8, 8, MONO_HLSB),
-    20: FrameBuffer(bytearray(b"\x00\x00\x00`\xa0\xa80 "), 8, 8, MONO_HLSB),
-    30: FrameBuffer(bytearray(b"\x00\x00\x00`\x90\xa8\x080"), 8, 8, MONO_HLSB),
-    40: FrameBuffer(bytearray(b"\x00\x00\x00\x00\x80\x90\xa0P"), 8, 8, MONO_HLSB),
-    50: FrameBuffer(bytearray(b"\x00\x00\x00@\x80x\x08\x10"), 8, 8, MONO_HLSB),
-    60: FrameBuffer(bytearray(b"\x00\x00\x00\xe00HH0"), 8, 8, MONO_HLSB),
-    70: FrameBuffer(bytearray(b"\x00\x00\x00 P\x90\x10\x08"), 8, 8, MONO_HLSB),
-    80: FrameBuffer(bytearray(b"\x00\x00\x00`\xa0\xf8(0"), 8, 8, MONO_HLSB),
-    90: FrameBuffer(bytearray(b"\x00\x00\x00`\x90\x98h\x08"), 8, 8, MONO_HLSB),
-    100: FrameBuffer(bytearray(b"\x00\x00\x00`\x90\x88H0"), 8, 8, MONO_HLSB),
-}
+glyphs_setup = Font(
+    GLYPHS,
+    {
+        0: 0,
+        1: 8,
+        2: 16,
+        3: 24,
+        4: 32,
+        5: 40,
+        6: 48,
+        7: 56,
+        8: 64,
+        9: 72,
+        10: 80,
+        15: 88,
+        20: 96,
+        25: 104,
+        30: 112,
+        35: 120,
+        40: 128,
+        45: 136,
+        50: 144,
+        55: 152,
+        60: 160,
+        "m": 168,
+        "s": 176,
+    },
+)
+
+glyphs_clock = Font(
+    GLYPHS,
+    {
+        0: 184,
+        1: 192,
+        2: 200,
+        3: 208,
+        4: 216,
+        5: 224,
+        6: 232,
+        7: 240,
+        8: 248,
+        9: 256,
+        10: 264,
+        20: 272,
+        30: 280,
+        40: 288,
+        50: 296,
+        60: 304,
+        70: 312,
+        80: 320,
+        90: 328,
+        100: 336,
+    },
+)
@@ -0,0 +1,70 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+from config import HEAP_DEBUG
+
+try:
+    from gc import mem_alloc
+except ImportError:
+    # Emulation - traced memory is just approximation of allocations
+    # as CPython releases objects immediately
+    from tracemalloc import start, get_traced_memory
+
+    def mem_alloc() -> int:
+        return get_traced_memory()[0]
+
+    if HEAP_DEBUG:
+        start()
+
+
+class HeapMon:
+    """Heap allocations monitor.
+
+    Measures bytes allocated by tasks in their frames (iterations of task loop)
+    as difference of allocated heap memory. Statistics are printed each time
+    when task accounts ``period`` frames.
+
+    :param period:    Count of frames between reports
+    """
+
+    def __init__(self, period: int = 1000):
+        self._period = period
+        self._stats = dict()
+
+    def mark(self) -> int:
+        """Mark beginning of frame.
+
+        :return:    Mark to be passed to :meth:`account`
+        """
+        return mem_alloc()
+
+    def account(self, name: str, mark: int) -> None:
+        """Account end of frame.
+
+        :param name:    Name of task
+        :param mark:    Mark returned by :meth:`mark` at the beginning of frame
+        """
+        delta = mem_alloc() - mark
+        stats = self._stats.get(name, None)
+        if stats is None:
+            stats = self._stats[name] = [0, 0, 0]
+
+        # Negative delta means garbage collection during frame
+        if delta > 0:
+            stats[1] += delta
+            stats[2] = max(stats[2], delta)
+
+        stats[0] += 1
+        if stats[0] == self._period:
+            print(
+                "Heap:",
+                name,
+                "allocated",
+                stats[1] // stats[0],
+                "B/frame, max",
+                stats[2],
+                "B",
+            )
+            stats[0] = stats[1] = stats[2] = 0
+
+
+# Heap monitor shared by application (None when heap debugging is disabled)
+heapmon = HeapMon() if HEAP_DEBUG else None
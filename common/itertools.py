@@ -1,17 +1,17 @@
 # MIT license; Copyright (c) 2023 Ondrej Sienczak
-from random import getrandbits
+from .xorshift import rng as _rng, XorShift
 
 
-def range_rnd(cnt: int):
-    return range(cnt) if getrandbits(1) else reversed(range(cnt))
+def range_rnd(cnt: int, rng: XorShift = _rng):
+    return range(cnt) if rng.getrandbits(1) else reversed(range(cnt))
 
 
-def product_rnd(x_max: int, y_max: int):
-    if getrandbits(1):
-        for x in range_rnd(x_max):
-            for y in range_rnd(y_max):
+def product_rnd(x_max: int, y_max: int, rng: XorShift = _rng):
+    if rng.getrandbits(1):
+        for x in range_rnd(x_max, rng):
+            for y in range_rnd(y_max, rng):
                 yield x, y
     else:
-        for y in range_rnd(y_max):
-            for x in range_rnd(x_max):
+        for y in range_rnd(y_max, rng):
+            for x in range_rnd(x_max, rng):
                 yield x, y
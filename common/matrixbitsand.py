@@ -0,0 +1,96 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+from .matrixsand import MatrixSand
+from .sandtables import SHIFTS, PROGRAMS, INDEX
+from .xorshift import XorShift
+
+
+class MatrixBitSand(MatrixSand):
+    """Sand animation working on whole rows of grains at once.
+
+    Each row of 8x8 matrix is stored in single byte (bit 7 is X coordinate 0).
+    Instead of visiting every grain, whole rows are moved by shifting and masking
+    of row bytes. Step is done in phases. In first phase grains moves in direction
+    of gravity. Grains which has been blocked then try to slide along X or Y axis
+    only (order of both sliding phases is random, so the pile stays symmetric).
+
+    Every phase is processed rows against gravity, so each grain sees other grains
+    as they was in the beginning of phase. Therefore two grains can never meet in
+    the same pixel and count of grains is preserved.
+
+    Phases are precomputed for each gravity direction (see :mod:`sandtables`)
+    as programs of row operations, so one step is just sequence of table lookups.
+
+    Rows are modified in place (see :meth:`MatrixBuffer.edit`). Each moved grain
+    toggles its changed state bits, so there is no copy of buffer nor comparison
+    of buffers needed to find out what has been changed.
+
+    :param rng:    Random generator (shared application generator by default)
+    """
+
+    def __init__(self, rng: XorShift = None):
+        super().__init__(8, 8, rng=rng)
+        self._stay = bytearray(8)
+
+    def _step(self, d: int) -> bool:
+        """Process one sand grains animation step.
+
+        :param d:    Direction of gravity (see :meth:`_direction`)
+
+        :return:    State if something has been animated or not
+        """
+        i = d * 4
+        main, slide_y, slide_x, end = INDEX[i], INDEX[i + 1], INDEX[i + 2], INDEX[i + 3]
+
+        chg = self.edit()
+        rows = self.rows
+        stay = self._stay
+        stay[:] = rows
+
+        moved = self._run(rows, chg, stay, main, slide_y)
+
+        # Blocked grains can still slide along one of axis
+        if self._rng.getrandbits(1):
+            moved |= self._run(rows, chg, stay, slide_y, slide_x)
+            moved |= self._run(rows, chg, stay, slide_x, end)
+        else:
+            moved |= self._run(rows, chg, stay, slide_x, end)
+            moved |= self._run(rows, chg, stay, slide_y, slide_x)
+
+        self.touch(moved)
+
+        return moved != 0
+
+    @staticmethod
+    def _run(
+        rows: bytearray, chg: bytearray, stay: bytearray, start: int, end: int
+    ) -> int:
+        """Run section of program moving rows of grains.
+
+        Each operation moves grains which has not moved yet from source row
+        to destination row (shifted by forward table) when target pixel is free.
+
+        :param rows:    Rows of grains to be modified
+        :param chg:     Rows of changed states toggled together with grains
+        :param stay:    Rows of grains which has not been moved yet in this step
+        :param start:   First operation of section
+        :param end:     Operation following last operation of section
+
+        :return:    Mask of rows where some grain has been moved (0 when nothing moved)
+        """
+        moved = 0
+
+        for op in range(start * 4, end * 4, 4):
+            src = PROGRAMS[op]
+            dst = PROGRAMS[op + 1]
+            to = SHIFTS[(PROGRAMS[op + 2] << 8) | stay[src]] & ~rows[dst]
+
+            if to:
+                fr = SHIFTS[(PROGRAMS[op + 3] << 8) | to]
+                stay[src] ^= fr
+                rows[src] ^= fr
+                rows[dst] |= to
+                chg[src] ^= fr
+                chg[dst] ^= to
+                moved |= (1 << src) | (1 << dst)
+
+        return moved
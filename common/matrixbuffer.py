@@ -1,5 +1,12 @@
 # MIT license; Copyright (c) 2023 Ondrej Sienczak
 from framebuf import FrameBuffer, MONO_HLSB
+from micropython import const
+
+
+# Rows tracked one by one in mask of dirty rows. Mask has to fit small integer
+# (30 bits on 32 bit ports), so it never allocates. Change of any further row is
+# tracked as change of whole buffer (see `MatrixBuffer.forced`).
+DIRTY_ROWS = const(24)
 
 
 class MatrixBuffer:
@@ -9,6 +16,12 @@ class MatrixBuffer:
     about pixels to be repainted to save some time needed for communication with display
     when there is not that much pixels changed during animation.
 
+    Besides changed pixels, buffer collects mask of changed (dirty) rows. Rows are
+    collected till display shows them and calls `clean`, so rows changed in frames
+    which has not been shown are not lost. Only first ``DIRTY_ROWS`` rows are
+    tracked in mask. Taller buffers are marked as whole dirty (`forced`) when
+    some of remaining rows changes.
+
     :param width:    Display width
     :param height:   Display height
     """
@@ -24,10 +37,13 @@ class MatrixBuffer:
             FrameBuffer(self._buffs[i], width, height, MONO_HLSB) for i in range(2, 4)
         ]
         self._act = 0
+        self._stride = (width + 7) // 8
+        self._all = (1 << min(height, DIRTY_ROWS)) - 1
+        self._dirty = self._all
+        self._forced = True
 
-        for buff in self._buffs[2:4]:
-            for i in range(len(buff)):
-                buff[i] = 255
+        for changed in self._changed:
+            changed.fill(1)
 
     def __getitem__(self, key: tuple[int, int]) -> tuple[int, int]:
         """Get pixel state.
@@ -50,12 +66,36 @@ class MatrixBuffer:
         if grains.pixel(*key) != value:
             grains.pixel(*key, value)
             self._changed[self._act].pixel(*key, 1)
+            if key[1] < DIRTY_ROWS:
+                self._dirty |= 1 << key[1]
+            else:
+                self._mark(1 << DIRTY_ROWS)
+
+    @property
+    def size(self) -> bytearray:
+        """Display width and height."""
+        return self._dim
+
+    @property
+    def dirty(self) -> int:
+        """Mask of rows changed since last `clean` (bit 0 is row 0)."""
+        return self._dirty
+
+    @property
+    def forced(self) -> bool:
+        """Whole buffer has to be repainted since last `clean` (see `force_all`)."""
+        return self._forced
+
+    def clean(self) -> None:
+        """Mark all rows as clean (called by display when rows has been shown)."""
+        self._dirty = 0
+        self._forced = False
 
     def force_all(self) -> None:
         """Mark all pixels as changed."""
-        b = self._buffs[self._act + 2]
-        for i in range(len(b)):
-            b[i] = 255
+        self._changed[self._act].fill(1)
+        self._dirty = self._all
+        self._forced = True
 
     def blit(self, fbuf: FrameBuffer, x: int, y: int, key: int = -1) -> None:
         """Paint frame buffer over pixels.
@@ -67,9 +107,28 @@ class MatrixBuffer:
         """
         act = self._act
         self._pixels[act].blit(fbuf, x, y, key)
-        b = self._buffs[act + 2]
+        self.force_all()
+
+    def load(self, rows: bytes) -> None:
+        """Load whole pixels map.
+
+        Unlike `blit` only pixels and rows which really differs from current
+        ones are marked as changed.
+
+        :param rows:    Pixels map (row by row in ``MONO_HLSB`` format).
+        """
+        act = self._act
+        b = self._buffs[act]
+        chb = self._buffs[act + 2]
+        stride = self._stride
+        dirty = 0
         for i in range(len(b)):
-            b[i] = 255
+            c = b[i] ^ rows[i]
+            if c:
+                b[i] = rows[i]
+                chb[i] |= c
+                dirty |= 1 << min(i // stride, DIRTY_ROWS)
+        self._mark(dirty)
 
     @property
     def buffs(self) -> tuple[bytearray, bytearray]:
@@ -80,6 +139,17 @@ class MatrixBuffer:
         act = self._act
         return self._buffs[act], self._buffs[act + 2]
 
+    @property
+    def rows(self) -> bytearray:
+        """Get current active pixels map.
+
+        Unlike :attr:`buffs` this does not allocate tuple, so it is suitable for
+        repeated access during display refresh.
+
+        :return:    Pixels map (row by row in ``MONO_HLSB`` format).
+        """
+        return self._buffs[self._act]
+
     @property
     def pixels(self) -> FrameBuffer:
         """Get current active frame buffers.
@@ -98,6 +168,39 @@ class MatrixBuffer:
         """
         return self._pixels[self._act]
 
+    def edit(self) -> bytearray:
+        """Start modification of active pixels in place.
+
+        This is zero copy alternative to `make_copy` and `use_copy` for writers working
+        directly with pixel rows (see :attr:`rows`). Change states are cleared and returned,
+        so writer can toggle changed state of each pixel it toggles (``changed[i] ^= bits``).
+        Writer then reports rows it touched by `touch`. No copy of pixels nor comparison
+        of buffers is needed then.
+
+        :return:    Changed state map (row by row in ``MONO_HLSB`` format).
+        """
+        act = self._act
+        self._changed[act].fill(0)
+        return self._buffs[act + 2]
+
+    def touch(self, rows: int) -> None:
+        """Mark rows modified by writer as dirty.
+
+        :param rows:    Mask of rows (bit 0 is row 0)
+        """
+        self._mark(rows)
+
+    def _mark(self, rows: int) -> None:
+        """Add rows to mask of dirty rows.
+
+        :param rows:    Mask of rows (bit ``DIRTY_ROWS`` stands for any of rows not tracked)
+        """
+        if rows >> DIRTY_ROWS:
+            self._dirty = self._all
+            self._forced = True
+        else:
+            self._dirty |= rows
+
     def make_copy(self) -> FrameBuffer:
         """Make and return copy of inactive frame buffers.
 
@@ -118,20 +221,22 @@ class MatrixBuffer:
         act = self._act
         next_buf = (act + 1) % 2
         chb = self._buffs[next_buf + 2]
-        for i, n, o in zip(range(len(chb)), self._buffs[next_buf], self._buffs[act]):
-            chb[i] = n ^ o
+        n = self._buffs[next_buf]
+        o = self._buffs[act]
+        stride = self._stride
+        dirty = 0
+        for i in range(len(chb)):
+            c = n[i] ^ o[i]
+            chb[i] = c
+            if c:
+                dirty |= 1 << min(i // stride, DIRTY_ROWS)
         self._act = next_buf
+        self._mark(dirty)
 
     def reset(self, fill: bool) -> None:
         """Reset display to be either fully clear or fully filled.
 
         :param fill:    Either fill when ``True`` or clear when ``False``.
         """
-        if fill:
-            fill = 255
-
         self.force_all()
-
-        b = self.buffs[0]
-        for i in range(len(b)):
-            b[i] = fill
+        self._pixels[self._act].fill(1 if fill else 0)
@@ -4,16 +4,57 @@
 #
 # Note: Optimized for Micropython by OSi (2023)
 from .itertools import product_rnd
-from .matrixbuffer import MatrixBuffer
-from random import getrandbits
+from .matrixbuffer import MatrixBuffer, DIRTY_ROWS
+from framebuf import FrameBuffer
+from .sandtables import DIRS, UNITS, MARGOLUS
+from .xorshift import rng as _rng, XorShift
+from micropython import const
+
+
+SAND_SERIAL = const(0)
+SAND_MARGOLUS = const(1)
 
 
 class MatrixSand(MatrixBuffer):
-    """Extension of frame buffer with capability of animating the sand."""
+    """Extension of frame buffer with capability of animating the sand.
+
+    Sand remembers direction of gravity in which it has been settled (no grain
+    moved). Animation steps are then skipped till the direction of gravity changes
+    or till some grain is added or removed.
+
+    There are two rules of sand animation. Serial rule (:data:`SAND_SERIAL`) moves
+    grains one by one, so each grain sees moves of grains visited before. Margolus
+    rule (:data:`SAND_MARGOLUS`) splits matrix to 2x2 blocks (shifted by one pixel
+    in every other step) and each block is updated independently on other blocks
+    by lookup table.
+
+    :param width:    Display width
+    :param height:   Display height
+    :param rule:     Sand animation rule
+    :param rng:      Random generator (shared application generator by default)
+    """
 
-    def __init__(self, width: int = 8, height: int = 8):
+    def __init__(
+        self,
+        width: int = 8,
+        height: int = 8,
+        rule: int = SAND_SERIAL,
+        rng: XorShift = None,
+    ):
         super().__init__(width, height)
+        self._rng = _rng if rng is None else rng
+        self._rule = rule
+        self._phase = 0
         self._len = 0
+        self._settled = -1
+        # Frontier flags of pixels (walked frontier is cleared during walk)
+        self._front = bytearray(width * height)
+        self._front_next = bytearray(width * height)
+        self._front_len = 0
+        self._front_dir = -1
+        self._zeros = bytes(width * height)
+        self._walk = None
+        self._left = 0
 
     def __len__(self) -> int:
         """Count of grains."""
@@ -28,8 +69,19 @@ class MatrixSand(MatrixBuffer):
         grains = self._pixels[self._act]
         if grains.pixel(*key) != value:
             self._len += 1 if value else -1
+            self._settled = -1
             grains.pixel(*key, value)
             self._changed[self._act].pixel(*key, 1)
+            if key[1] < DIRTY_ROWS:
+                self._dirty |= 1 << key[1]
+            else:
+                self._mark(1 << DIRTY_ROWS)
+
+            if value:
+                if self._front_dir >= 0:
+                    self._add(key[1] * self._dim[0] + key[0])
+            else:
+                self._wake(grains, *key)
 
     def iterate(self, ax: float, ay: float) -> bool:
         """Iterate sand grains animation.
@@ -41,24 +93,69 @@ class MatrixSand(MatrixBuffer):
 
         :return:    State if something has been animated or not
         """
-        # unit vectors for accelerometer
-        ix = iy = 0
-        if abs(ax) > 0.01:
-            ratio = abs(ay / ax)
-            if ratio < 2.414:  # tan(67.5deg)
-                ix = 1 if ax > 0 else -1
-            if ratio > 0.414:  # tan(22.5deg)
-                iy = 1 if ay > 0 else -1
-        else:
-            iy = 1 if ay > 0 else -1
+        d = self._direction(ax, ay)
+
+        # Nothing can move when sand has been already settled in this direction
+        if d == self._settled:
+            return False
+
+        animated = self._step(d)
+        if not animated:
+            self._settled = d
+
+        return animated
+
+    def _step(self, d: int) -> bool:
+        """Process one sand grains animation step.
+
+        Only grains from active frontier are visited. Frontier contains grains
+        which may move - grains which moved in previous step and grains next to
+        pixel which has been freed. Any other grain is blocked, so there is no need
+        to check it. Frontier is rebuilt from all grains when direction changes.
+
+        :param d:    Direction of gravity (see :meth:`_direction`)
+
+        :return:    State if something has been animated or not
+        """
+        if self._rule == SAND_MARGOLUS:
+            return self._margolus(d)
+
+        ix, iy = UNITS[d]
+        width = self._dim[0]
 
         # buffer
         grains = self.pixels
         new_grains = self.make_copy()
         animated = False
 
-        # loop through the grains
-        for x, y in product_rnd(*self._dim):
+        # frontier of grains which can move
+        if d != self._front_dir:
+            self._front_dir = d
+            front = self._front
+            count = 0
+            for y in range(self._dim[1]):
+                for x in range(width):
+                    v = grains.pixel(x, y)
+                    front[y * width + x] = v
+                    count += v
+            self._front_len = count
+
+        front, self._front = self._front, self._front_next
+        self._front_next = front
+        self._left, self._front_len = self._front_len, 0
+        self._walk = front
+
+        # loop through the grains of frontier in the same random order as all
+        # grains would be visited (frontier is cleared on the way, so walk ends
+        # by the last grain of frontier)
+        for x, y in product_rnd(*self._dim, self._rng):
+            if not self._left:
+                break
+            p = y * width + x
+            if not front[p]:
+                continue
+            front[p] = 0
+            self._left -= 1
             # is there a grain here?
             if grains.pixel(x, y):
                 moved = False
@@ -70,7 +167,7 @@ class MatrixSand(MatrixBuffer):
                 newy = max(min(self._diml[1], newy), 0)
                 # wants to move?
                 if x != newx or y != newy:
-                    moved = animated = True
+                    moved = True
                     # is it blocked?
                     if new_grains.pixel(newx, newy):
                         # can we move diagonally?
@@ -79,7 +176,7 @@ class MatrixSand(MatrixBuffer):
                         ):
                             # can move either way
                             # move away from random side
-                            if getrandbits(1):
+                            if self._rng.getrandbits(1):
                                 newy = y
                             else:
                                 newx = x
@@ -91,30 +188,155 @@ class MatrixSand(MatrixBuffer):
                             newy = y
                         else:
                             # nope, totally blocked
-                            moved = animated = False
+                            moved = False
                 # did it move?
                 if moved:
+                    animated = True
                     new_grains.pixel(x, y, 0)
                     new_grains.pixel(newx, newy, 1)
+                    self._add(newy * width + newx)
+                    self._wake(new_grains, x, y)
+
+        # Grains woken behind the walk are already in next frontier
+        self._walk = None
+        if self._left:
+            front[:] = self._zeros
 
         # Repaint done - flip buffers
         self.use_copy()
 
         return animated
 
-    def reset(self, fill: bool) -> None:
-        """Reset display to be either fully clear or fully filled.
+    def _margolus(self, d: int) -> bool:
+        """Process one sand grains animation step by Margolus rule.
 
-        :param fill:    Either fill when ``True`` or clear when ``False``.
+        When nothing moved in current blocks phase, then also the other phase
+        is processed, so step is not animated only when sand is settled.
+
+        :param d:    Direction of gravity (see :meth:`_direction`)
+
+        :return:    State if something has been animated or not
+        """
+        table = (d * 2 + self._rng.getrandbits(1)) * 256
+        grains = self.pixels
+        new_grains = self.make_copy()
+
+        animated = self._blocks(grains, new_grains, table)
+        if not animated:
+            animated = self._blocks(grains, new_grains, table)
+
+        # Repaint done - flip buffers
+        self.use_copy()
+
+        return animated
+
+    def _blocks(self, grains: FrameBuffer, new_grains: FrameBuffer, table: int) -> bool:
+        """Update all 2x2 blocks of current phase.
+
+        Blocks crossing edge of matrix are completed by walls. Walls are pixels
+        of block which are never free and never move (each table has transitions
+        for all combinations of walls).
+
+        :param grains:      Frame buffer with grains to be read
+        :param new_grains:  Frame buffer where new grains are written
+        :param table:       Offset of blocks transition table
+
+        :return:    State if some grain has been moved or not
         """
-        if fill:
-            fill = 255
-            self._len = 64
+        o = self._phase
+        self._phase ^= 1
+        width, height = self._dim
+        animated = False
+
+        for y in range(-o, height, 2):
+            wy = 0b1100 if y < 0 else 0b0011 if y + 1 >= height else 0
+
+            for x in range(-o, width, 2):
+                wx = 0b1010 if x < 0 else 0b0101 if x + 1 >= width else 0
+                b = (
+                    grains.pixel(x, y) << 3
+                    | grains.pixel(x + 1, y) << 2
+                    | grains.pixel(x, y + 1) << 1
+                    | grains.pixel(x + 1, y + 1)
+                )
+                n = MARGOLUS[table + ((wx | wy) << 4 | b)]
+
+                if n != b:
+                    animated = True
+                    new_grains.pixel(x, y, n >> 3)
+                    new_grains.pixel(x + 1, y, (n >> 2) & 1)
+                    new_grains.pixel(x, y + 1, (n >> 1) & 1)
+                    new_grains.pixel(x + 1, y + 1, n & 1)
+
+        return animated
+
+    def _wake(self, grains: FrameBuffer, x: int, y: int) -> None:
+        """Add grains which may move to freed pixel to frontier.
+
+        :param grains:  Frame buffer with grains
+        :param x:       X coordinate of freed pixel
+        :param y:       Y coordinate of freed pixel
+        """
+        if self._front_dir < 0:
+            return
+
+        ix, iy = UNITS[self._front_dir]
+        width, height = self._dim
+
+        for nx, ny in (x - ix, y - iy), (x, y - iy), (x - ix, y):
+            if (
+                (nx != x or ny != y)
+                and 0 <= nx < width
+                and 0 <= ny < height
+                and grains.pixel(nx, ny)
+            ):
+                p = ny * width + nx
+                self._add(p)
+
+                # Grain in front of walk can move in current step
+                walk = self._walk
+                if walk is not None and not walk[p]:
+                    walk[p] = 1
+                    self._left += 1
+
+    def _add(self, p: int) -> None:
+        """Add pixel to frontier.
+
+        :param p:    Pixel index (``y * width + x``)
+        """
+        if not self._front[p]:
+            self._front[p] = 1
+            self._front_len += 1
+
+    @staticmethod
+    def _direction(ax: float, ay: float) -> int:
+        """Quantize gravity to one of 8 directions.
+
+        Uses integer arithmetic only to avoid floating point division.
+
+        :param ax:    Accelerometer (gravity) in direction X
+        :param ay:    Accelerometer (gravity) in direction Y
+
+        :return:    Direction index (see :data:`sandtables.UNITS`)
+        """
+        ix = iy = 0
+        aax = abs(ax)
+        if aax > 0.01:
+            aay = abs(ay)
+            if aay * 1000 < aax * 2414:  # tan(67.5deg)
+                ix = 1 if ax > 0 else -1
+            if aay * 1000 > aax * 414:  # tan(22.5deg)
+                iy = 1 if ay > 0 else -1
         else:
-            self._len = 0
+            iy = 1 if ay > 0 else -1
+        return DIRS[ix * 3 + iy + 4]
 
-        self.force_all()
+    def reset(self, fill: bool) -> None:
+        """Reset display to be either fully clear or fully filled.
 
-        b = self.buffs[0]
-        for i in range(len(b)):
-            b[i] = fill
+        :param fill:    Either fill when ``True`` or clear when ``False``.
+        """
+        self._len = self._dim[0] * self._dim[1] if fill else 0
+        self._settled = -1
+        self._front_dir = -1
+        super().reset(fill)
@@ -0,0 +1,252 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+"""Sand animation for large matrices on host.
+
+This module requires NumPy and it is intended for emulator only (prototyping of
+large LED walls), it is not used on device.
+"""
+from .matrixsand import MatrixSand, SAND_SERIAL, SAND_MARGOLUS
+from .sandtables import UNITS, MARGOLUS
+from .xorshift import rng as _rng, XorShift
+import numpy as np
+
+
+_MARGOLUS = np.frombuffer(MARGOLUS, dtype=np.uint8)
+
+
+class NumpySand:
+    """Sand animation backed by NumPy boolean arrays.
+
+    Provides the same interface as :class:`MatrixSand`, but whole matrix is moved
+    at once by vectorized shifts. Serial rule moves grains the same way as
+    :class:`MatrixBitSand` does (all grains of phase are moved in parallel), Margolus
+    rule uses the same block tables as :class:`MatrixSand`.
+
+    :param width:    Display width
+    :param height:   Display height
+    :param rule:     Sand animation rule
+    :param rng:      Random generator (shared application generator by default)
+    """
+
+    def __init__(
+        self,
+        width: int = 64,
+        height: int = 64,
+        rule: int = SAND_SERIAL,
+        rng: XorShift = None,
+    ):
+        self._rng = _rng if rng is None else rng
+        self._grains = np.zeros((height, width), dtype=bool)
+        self._changed = np.ones((height, width), dtype=bool)
+        self._dirty = (1 << height) - 1
+        self._forced = True
+        self._rule = rule
+        self._phase = 0
+        self._settled = -1
+
+    def __len__(self) -> int:
+        """Count of grains."""
+        return int(np.count_nonzero(self._grains))
+
+    def __getitem__(self, key: tuple[int, int]) -> tuple[int, int]:
+        """Get pixel state.
+
+        :param key:    Tuple containing x and y display coordinates.
+
+        :return:       Tuple containing pixel value and pixel change state.
+        """
+        x, y = key
+        return int(self._grains[y, x]), int(self._changed[y, x])
+
+    def __setitem__(self, key: tuple[int, int], value: int) -> None:
+        """Set grain.
+
+        :param key:    Tuple containing x and y display coordinates.
+        """
+        x, y = key
+        if self._grains[y, x] != bool(value):
+            self._grains[y, x] = value
+            self._changed[y, x] = True
+            self._dirty |= 1 << y
+            self._settled = -1
+
+    @property
+    def buffs(self) -> tuple[bytearray, bytearray]:
+        """Get current buffers in ``MONO_HLSB`` format.
+
+        :return:    Tuple containing pixels map and changed state map.
+        """
+        return (
+            bytearray(np.packbits(self._grains, axis=1).tobytes()),
+            bytearray(np.packbits(self._changed, axis=1).tobytes()),
+        )
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """Display width and height."""
+        return self._grains.shape[1], self._grains.shape[0]
+
+    @property
+    def dirty(self) -> int:
+        """Mask of rows changed since last `clean` (bit 0 is row 0)."""
+        return self._dirty
+
+    @property
+    def forced(self) -> bool:
+        """Whole buffer has to be repainted since last `clean` (see `force_all`)."""
+        return self._forced
+
+    def clean(self) -> None:
+        """Mark all rows as clean."""
+        self._dirty = 0
+        self._forced = False
+
+    @property
+    def rows(self) -> bytearray:
+        """Get current pixels map in ``MONO_HLSB`` format."""
+        return bytearray(np.packbits(self._grains, axis=1).tobytes())
+
+    @property
+    def grains(self) -> np.ndarray:
+        """Get array of grains (indexed by Y and X)."""
+        return self._grains
+
+    def force_all(self) -> None:
+        """Mark all pixels as changed."""
+        self._changed[:] = True
+        self._dirty = (1 << len(self._grains)) - 1
+        self._forced = True
+
+    def reset(self, fill: bool) -> None:
+        """Reset display to be either fully clear or fully filled.
+
+        :param fill:    Either fill when ``True`` or clear when ``False``.
+        """
+        self._grains[:] = bool(fill)
+        self.force_all()
+        self._settled = -1
+
+    def iterate(self, ax: float, ay: float) -> bool:
+        """Iterate sand grains animation.
+
+        Process one sand grains animation step in direction of gravity.
+
+        :param ax:    Accelerometer (gravity) in direction X
+        :param ay:    Accelerometer (gravity) in direction Y
+
+        :return:    State if something has been animated or not
+        """
+        d = MatrixSand._direction(ax, ay)
+
+        # Nothing can move when sand has been already settled in this direction
+        if d == self._settled:
+            return False
+
+        old = self._grains.copy()
+
+        if self._rule == SAND_MARGOLUS:
+            animated = self._margolus(d)
+        else:
+            animated = self._serial(d)
+
+        np.not_equal(old, self._grains, out=self._changed)
+        for y in np.flatnonzero(self._changed.any(axis=1)):
+            self._dirty |= 1 << int(y)
+
+        if not animated:
+            self._settled = d
+
+        return animated
+
+    def _serial(self, d: int) -> bool:
+        ix, iy = UNITS[d]
+        stay = self._grains.copy()
+
+        animated = self._move(stay, iy, ix)
+        y_first = self._rng.getrandbits(1)
+
+        if ix and iy:
+            # Blocked grains can still slide along one of axis
+            if y_first:
+                animated |= self._move(stay, iy, 0)
+                animated |= self._move(stay, 0, ix)
+            else:
+                animated |= self._move(stay, 0, ix)
+                animated |= self._move(stay, iy, 0)
+
+        return animated
+
+    def _move(self, stay: np.ndarray, dy: int, dx: int) -> bool:
+        """Move all grains which can move by given offset.
+
+        Grains on the edge are not moved in direction of edge.
+
+        :param stay:    Grains which has not been moved yet in this step
+        :param dy:      Offset in direction Y
+        :param dx:      Offset in direction X
+
+        :return:    State if some grain has been moved or not
+        """
+        g = self._grains
+        h, w = g.shape
+        src = slice(max(0, -dy), h - max(0, dy)), slice(max(0, -dx), w - max(0, dx))
+        dst = slice(max(0, dy), h - max(0, -dy)), slice(max(0, dx), w - max(0, -dx))
+
+        moving = stay[src] & ~g[dst]
+        if not moving.any():
+            return False
+
+        g[src] &= ~moving
+        g[dst] |= moving
+        stay[src] &= ~moving
+        return True
+
+    def _margolus(self, d: int) -> bool:
+        table = (d * 2 + self._rng.getrandbits(1)) * 256
+
+        animated = self._blocks(table)
+        if not animated:
+            animated = self._blocks(table)
+
+        return animated
+
+    def _blocks(self, table: int) -> bool:
+        """Update all 2x2 blocks of current phase.
+
+        Blocks crossing edge of matrix are completed by walls (see
+        :meth:`MatrixSand._blocks`).
+
+        :param table:    Offset of blocks transition table
+
+        :return:    State if some grain has been moved or not
+        """
+        o = self._phase
+        self._phase ^= 1
+
+        g = self._grains
+        h, w = g.shape
+        pad = (o, (h + o) % 2), (o, (w + o) % 2)
+        p = np.pad(g, pad, constant_values=False).astype(np.uint8)
+        walls = np.pad(np.zeros_like(g, dtype=np.intp), pad, constant_values=1)
+
+        def pattern(a):
+            return (
+                a[0::2, 0::2] << 3
+                | a[0::2, 1::2] << 2
+                | a[1::2, 0::2] << 1
+                | a[1::2, 1::2]
+            )
+
+        b = pattern(p)
+        walls = pattern(walls)
+
+        n = _MARGOLUS[table + (walls << 4 | b)]
+
+        if np.array_equal(n, b):
+            return False
+
+        p[0::2, 0::2] = n >> 3
+        p[0::2, 1::2] = (n >> 2) & 1
+        p[1::2, 0::2] = (n >> 1) & 1
+        p[1::2, 1::2] = n & 1
+        g[:] = p[o : o + h, o : o + w]
+        return True
@@ -0,0 +1,73 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+from uasyncio import Event, sleep_ms, wait_for_ms, TimeoutError
+from utime import ticks_ms, ticks_diff
+
+
+class FramePacer:
+    """Frame scheduler keeping animation at constant frame rate.
+
+    Time spent by frame work is subtracted from frame period, so frames are
+    scheduled in real frame period. When there is nothing to animate, frames
+    are slowed down to idle period till :meth:`wake` is called or till
+    requested deadline.
+
+    Achieved frame rate and frame work time statistics are updated every second.
+
+    :param period:    Frame period in milliseconds
+    :param idle:      Frame period in milliseconds when nothing is animated
+    """
+
+    def __init__(self, period: int = 10, idle: int = 200):
+        self.period = period
+        self.idle = idle
+        self.fps = 0
+        self.work_ms = 0
+        self.work_max = 0
+        self._wake = Event()
+        self._start = ticks_ms()
+        self._stats = self._start
+        self._frames = 0
+        self._work = 0
+        self._max = 0
+
+    def wake(self) -> None:
+        """Wake up idle frame immediately"""
+        self._wake.set()
+
+    async def frame(self, busy: bool, deadline: int = None) -> None:
+        """Finish frame work and wait for the next frame.
+
+        :param busy:        Something has been animated in this frame
+        :param deadline:    Time (in ticks) of next event when idle
+        """
+        now = ticks_ms()
+        work = ticks_diff(now, self._start)
+        self._account(now, work)
+
+        if busy:
+            await sleep_ms(max(0, self.period - work))
+        else:
+            delay = self.idle
+            if deadline is not None:
+                delay = max(0, min(delay, ticks_diff(deadline, now)))
+
+            self._wake.clear()
+            try:
+                await wait_for_ms(self._wake.wait(), delay)
+            except TimeoutError:
+                pass
+
+        self._start = ticks_ms()
+
+    def _account(self, now: int, work: int) -> None:
+        self._frames += 1
+        self._work += work
+        self._max = max(self._max, work)
+
+        elapsed = ticks_diff(now, self._stats)
+        if elapsed >= 1000:
+            self.fps = self._frames * 1000 // elapsed
+            self.work_ms = self._work // self._frames
+            self.work_max = self._max
+            self._stats = now
+            self._frames = self._work = self._max = 0
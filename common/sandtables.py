@@ -0,0 +1,357 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+#
+# Generated by tools/mksandtables.py - do not edit.
+
+UNITS = ((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1))
+
+DIRS = (
+    b"\x05\x04\x03\x06\x00\x02\x07\x00\x01"
+)
+
+SHIFTS = (
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f"
+    b"\x20\x21\x22\x23\x24\x25\x26\x27\x28\x29\x2a\x2b\x2c\x2d\x2e\x2f"
+    b"\x30\x31\x32\x33\x34\x35\x36\x37\x38\x39\x3a\x3b\x3c\x3d\x3e\x3f"
+    b"\x40\x41\x42\x43\x44\x45\x46\x47\x48\x49\x4a\x4b\x4c\x4d\x4e\x4f"
+    b"\x50\x51\x52\x53\x54\x55\x56\x57\x58\x59\x5a\x5b\x5c\x5d\x5e\x5f"
+    b"\x60\x61\x62\x63\x64\x65\x66\x67\x68\x69\x6a\x6b\x6c\x6d\x6e\x6f"
+    b"\x70\x71\x72\x73\x74\x75\x76\x77\x78\x79\x7a\x7b\x7c\x7d\x7e\x7f"
+    b"\x80\x81\x82\x83\x84\x85\x86\x87\x88\x89\x8a\x8b\x8c\x8d\x8e\x8f"
+    b"\x90\x91\x92\x93\x94\x95\x96\x97\x98\x99\x9a\x9b\x9c\x9d\x9e\x9f"
+    b"\xa0\xa1\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xab\xac\xad\xae\xaf"
+    b"\xb0\xb1\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xbb\xbc\xbd\xbe\xbf"
+    b"\xc0\xc1\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xcb\xcc\xcd\xce\xcf"
+    b"\xd0\xd1\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xdb\xdc\xdd\xde\xdf"
+    b"\xe0\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xeb\xec\xed\xee\xef"
+    b"\xf0\xf1\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xfb\xfc\xfd\xfe\xff"
+    b"\x00\x00\x01\x01\x02\x02\x03\x03\x04\x04\x05\x05\x06\x06\x07\x07"
+    b"\x08\x08\x09\x09\x0a\x0a\x0b\x0b\x0c\x0c\x0d\x0d\x0e\x0e\x0f\x0f"
+    b"\x10\x10\x11\x11\x12\x12\x13\x13\x14\x14\x15\x15\x16\x16\x17\x17"
+    b"\x18\x18\x19\x19\x1a\x1a\x1b\x1b\x1c\x1c\x1d\x1d\x1e\x1e\x1f\x1f"
+    b"\x20\x20\x21\x21\x22\x22\x23\x23\x24\x24\x25\x25\x26\x26\x27\x27"
+    b"\x28\x28\x29\x29\x2a\x2a\x2b\x2b\x2c\x2c\x2d\x2d\x2e\x2e\x2f\x2f"
+    b"\x30\x30\x31\x31\x32\x32\x33\x33\x34\x34\x35\x35\x36\x36\x37\x37"
+    b"\x38\x38\x39\x39\x3a\x3a\x3b\x3b\x3c\x3c\x3d\x3d\x3e\x3e\x3f\x3f"
+    b"\x40\x40\x41\x41\x42\x42\x43\x43\x44\x44\x45\x45\x46\x46\x47\x47"
+    b"\x48\x48\x49\x49\x4a\x4a\x4b\x4b\x4c\x4c\x4d\x4d\x4e\x4e\x4f\x4f"
+    b"\x50\x50\x51\x51\x52\x52\x53\x53\x54\x54\x55\x55\x56\x56\x57\x57"
+    b"\x58\x58\x59\x59\x5a\x5a\x5b\x5b\x5c\x5c\x5d\x5d\x5e\x5e\x5f\x5f"
+    b"\x60\x60\x61\x61\x62\x62\x63\x63\x64\x64\x65\x65\x66\x66\x67\x67"
+    b"\x68\x68\x69\x69\x6a\x6a\x6b\x6b\x6c\x6c\x6d\x6d\x6e\x6e\x6f\x6f"
+    b"\x70\x70\x71\x71\x72\x72\x73\x73\x74\x74\x75\x75\x76\x76\x77\x77"
+    b"\x78\x78\x79\x79\x7a\x7a\x7b\x7b\x7c\x7c\x7d\x7d\x7e\x7e\x7f\x7f"
+    b"\x00\x02\x04\x06\x08\x0a\x0c\x0e\x10\x12\x14\x16\x18\x1a\x1c\x1e"
+    b"\x20\x22\x24\x26\x28\x2a\x2c\x2e\x30\x32\x34\x36\x38\x3a\x3c\x3e"
+    b"\x40\x42\x44\x46\x48\x4a\x4c\x4e\x50\x52\x54\x56\x58\x5a\x5c\x5e"
+    b"\x60\x62\x64\x66\x68\x6a\x6c\x6e\x70\x72\x74\x76\x78\x7a\x7c\x7e"
+    b"\x80\x82\x84\x86\x88\x8a\x8c\x8e\x90\x92\x94\x96\x98\x9a\x9c\x9e"
+    b"\xa0\xa2\xa4\xa6\xa8\xaa\xac\xae\xb0\xb2\xb4\xb6\xb8\xba\xbc\xbe"
+    b"\xc0\xc2\xc4\xc6\xc8\xca\xcc\xce\xd0\xd2\xd4\xd6\xd8\xda\xdc\xde"
+    b"\xe0\xe2\xe4\xe6\xe8\xea\xec\xee\xf0\xf2\xf4\xf6\xf8\xfa\xfc\xfe"
+    b"\x00\x02\x04\x06\x08\x0a\x0c\x0e\x10\x12\x14\x16\x18\x1a\x1c\x1e"
+    b"\x20\x22\x24\x26\x28\x2a\x2c\x2e\x30\x32\x34\x36\x38\x3a\x3c\x3e"
+    b"\x40\x42\x44\x46\x48\x4a\x4c\x4e\x50\x52\x54\x56\x58\x5a\x5c\x5e"
+    b"\x60\x62\x64\x66\x68\x6a\x6c\x6e\x70\x72\x74\x76\x78\x7a\x7c\x7e"
+    b"\x80\x82\x84\x86\x88\x8a\x8c\x8e\x90\x92\x94\x96\x98\x9a\x9c\x9e"
+    b"\xa0\xa2\xa4\xa6\xa8\xaa\xac\xae\xb0\xb2\xb4\xb6\xb8\xba\xbc\xbe"
+    b"\xc0\xc2\xc4\xc6\xc8\xca\xcc\xce\xd0\xd2\xd4\xd6\xd8\xda\xdc\xde"
+    b"\xe0\xe2\xe4\xe6\xe8\xea\xec\xee\xf0\xf2\xf4\xf6\xf8\xfa\xfc\xfe"
+)
+
+PROGRAMS = (
+    b"\x00\x00\x01\x02\x01\x01\x01\x02\x02\x02\x01\x02\x03\x03\x01\x02"
+    b"\x04\x04\x01\x02\x05\x05\x01\x02\x06\x06\x01\x02\x07\x07\x01\x02"
+    b"\x00\x01\x01\x02\x01\x02\x01\x02\x02\x03\x01\x02\x03\x04\x01\x02"
+    b"\x04\x05\x01\x02\x05\x06\x01\x02\x06\x07\x01\x02\x00\x01\x00\x00"
+    b"\x01\x02\x00\x00\x02\x03\x00\x00\x03\x04\x00\x00\x04\x05\x00\x00"
+    b"\x05\x06\x00\x00\x06\x07\x00\x00\x00\x00\x01\x02\x01\x01\x01\x02"
+    b"\x02\x02\x01\x02\x03\x03\x01\x02\x04\x04\x01\x02\x05\x05\x01\x02"
+    b"\x06\x06\x01\x02\x07\x07\x01\x02\x00\x01\x00\x00\x01\x02\x00\x00"
+    b"\x02\x03\x00\x00\x03\x04\x00\x00\x04\x05\x00\x00\x05\x06\x00\x00"
+    b"\x06\x07\x00\x00\x00\x01\x02\x01\x01\x02\x02\x01\x02\x03\x02\x01"
+    b"\x03\x04\x02\x01\x04\x05\x02\x01\x05\x06\x02\x01\x06\x07\x02\x01"
+    b"\x00\x01\x00\x00\x01\x02\x00\x00\x02\x03\x00\x00\x03\x04\x00\x00"
+    b"\x04\x05\x00\x00\x05\x06\x00\x00\x06\x07\x00\x00\x00\x00\x02\x01"
+    b"\x01\x01\x02\x01\x02\x02\x02\x01\x03\x03\x02\x01\x04\x04\x02\x01"
+    b"\x05\x05\x02\x01\x06\x06\x02\x01\x07\x07\x02\x01\x00\x00\x02\x01"
+    b"\x01\x01\x02\x01\x02\x02\x02\x01\x03\x03\x02\x01\x04\x04\x02\x01"
+    b"\x05\x05\x02\x01\x06\x06\x02\x01\x07\x07\x02\x01\x07\x06\x02\x01"
+    b"\x06\x05\x02\x01\x05\x04\x02\x01\x04\x03\x02\x01\x03\x02\x02\x01"
+    b"\x02\x01\x02\x01\x01\x00\x02\x01\x07\x06\x00\x00\x06\x05\x00\x00"
+    b"\x05\x04\x00\x00\x04\x03\x00\x00\x03\x02\x00\x00\x02\x01\x00\x00"
+    b"\x01\x00\x00\x00\x00\x00\x02\x01\x01\x01\x02\x01\x02\x02\x02\x01"
+    b"\x03\x03\x02\x01\x04\x04\x02\x01\x05\x05\x02\x01\x06\x06\x02\x01"
+    b"\x07\x07\x02\x01\x07\x06\x00\x00\x06\x05\x00\x00\x05\x04\x00\x00"
+    b"\x04\x03\x00\x00\x03\x02\x00\x00\x02\x01\x00\x00\x01\x00\x00\x00"
+    b"\x07\x06\x01\x02\x06\x05\x01\x02\x05\x04\x01\x02\x04\x03\x01\x02"
+    b"\x03\x02\x01\x02\x02\x01\x01\x02\x01\x00\x01\x02\x07\x06\x00\x00"
+    b"\x06\x05\x00\x00\x05\x04\x00\x00\x04\x03\x00\x00\x03\x02\x00\x00"
+    b"\x02\x01\x00\x00\x01\x00\x00\x00\x00\x00\x01\x02\x01\x01\x01\x02"
+    b"\x02\x02\x01\x02\x03\x03\x01\x02\x04\x04\x01\x02\x05\x05\x01\x02"
+    b"\x06\x06\x01\x02\x07\x07\x01\x02"
+)
+
+INDEX = (
+    b"\x00\x08\x08\x08\x08\x0f\x16\x1e\x1e\x25\x25\x25\x25\x2c\x33\x3b"
+    b"\x3b\x43\x43\x43\x43\x4a\x51\x59\x59\x60\x60\x60\x60\x67\x6e\x76"
+)
+
+MARGOLUS = (
+    b"\x00\x01\x01\x05\x04\x05\x05\x07\x04\x05\x05\x07\x05\x0d\x07\x0f"
+    b"\x00\x01\x04\x03\x04\x05\x06\x07\x04\x09\x06\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x04\x05\x0a\x0b\x05\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x04\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x01\x03\x04\x05\x06\x07\x01\x09\x03\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x01\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x01\x05\x04\x05\x05\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x04\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x01\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x01\x05\x04\x05\x05\x07\x04\x05\x05\x0d\x05\x0d\x0d\x0f"
+    b"\x00\x01\x04\x03\x04\x05\x06\x07\x04\x09\x0c\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x04\x05\x0a\x0b\x05\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x04\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x01\x03\x04\x05\x06\x07\x01\x09\x09\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x01\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x01\x05\x04\x05\x05\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x04\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x01\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x01\x03\x01\x05\x03\x07\x01\x05\x05\x07\x05\x07\x07\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x04\x09\x06\x0b\x06\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x01\x05\x06\x07\x01\x05\x0a\x0b\x05\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x04\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x01\x03\x04\x05\x06\x07\x01\x03\x03\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x02\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x01\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x01\x03\x01\x05\x03\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x01\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x01\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x01\x03\x01\x05\x05\x07\x01\x03\x03\x07\x03\x07\x07\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x02\x09\x06\x0b\x06\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x01\x05\x06\x07\x01\x05\x0a\x0b\x05\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x04\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x01\x03\x04\x05\x06\x07\x01\x03\x03\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x02\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x01\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x01\x03\x01\x05\x05\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x01\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x01\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x01\x03\x03\x07\x02\x03\x03\x0b\x03\x07\x07\x0f"
+    b"\x00\x01\x02\x03\x02\x05\x06\x07\x02\x09\x0a\x0b\x06\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x01\x05\x06\x07\x01\x09\x0a\x0b\x05\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x02\x03\x03\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x02\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x01\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x01\x03\x03\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x02\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x01\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x01\x03\x03\x07\x02\x03\x03\x0b\x03\x0b\x0b\x0f"
+    b"\x00\x01\x02\x03\x02\x05\x06\x07\x02\x09\x0a\x0b\x0a\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x01\x05\x06\x07\x01\x09\x0a\x0b\x09\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x02\x03\x03\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x02\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x01\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x01\x03\x03\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x02\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x01\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x03\x02\x0a\x0a\x0b\x02\x03\x0a\x0b\x0a\x0b\x0b\x0f"
+    b"\x00\x01\x02\x03\x02\x05\x0a\x07\x02\x09\x0a\x0b\x0a\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x08\x09\x06\x07\x08\x09\x0a\x0b\x09\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x08\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x03\x04\x05\x06\x07\x02\x03\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x02\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x03\x02\x03\x03\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x02\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x01\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x03\x02\x03\x03\x0b\x02\x0a\x0a\x0b\x03\x0b\x0b\x0f"
+    b"\x00\x01\x02\x03\x02\x05\x0a\x07\x02\x09\x0a\x0b\x0a\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x01\x09\x06\x07\x08\x09\x0a\x0b\x09\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x08\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x03\x04\x05\x06\x07\x02\x0a\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x02\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x03\x02\x03\x03\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x02\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x01\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x0a\x08\x0a\x0a\x0b\x08\x0a\x0a\x0b\x0a\x0b\x0e\x0f"
+    b"\x00\x01\x02\x03\x08\x05\x0a\x07\x08\x09\x0a\x0b\x0a\x0d\x0e\x0f"
+    b"\x00\x08\x02\x03\x08\x09\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x08\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x0a\x04\x05\x06\x07\x08\x0a\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x08\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x03\x02\x03\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x02\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x0a\x08\x0a\x0a\x0e\x08\x0a\x0a\x0b\x0a\x0e\x0e\x0f"
+    b"\x00\x01\x02\x03\x08\x05\x0a\x07\x08\x09\x0a\x0b\x0a\x0d\x0e\x0f"
+    b"\x00\x08\x02\x03\x08\x0c\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x08\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x0a\x04\x05\x06\x07\x08\x0a\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x08\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x03\x02\x06\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x02\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x08\x08\x0c\x08\x0c\x0a\x0e\x08\x0c\x0a\x0e\x0c\x0e\x0e\x0f"
+    b"\x00\x01\x08\x03\x08\x05\x0a\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x08\x02\x03\x08\x0c\x06\x07\x08\x0c\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x08\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x08\x08\x0a\x04\x05\x06\x07\x08\x0a\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x08\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x08\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x02\x06\x04\x06\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x08\x08\x0a\x08\x0a\x0c\x0e\x08\x0a\x0a\x0e\x0c\x0e\x0e\x0f"
+    b"\x00\x01\x08\x03\x08\x05\x0c\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x08\x02\x03\x08\x0c\x06\x07\x08\x0c\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x08\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x08\x08\x0a\x04\x05\x06\x07\x08\x0a\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x08\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x08\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x06\x04\x06\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x02\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x08\x0c\x04\x0c\x0c\x0d\x08\x0c\x0c\x0d\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x08\x03\x04\x05\x0c\x07\x08\x09\x0c\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x02\x03\x04\x0c\x06\x07\x08\x0c\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x08\x08\x09\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x08\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x08\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x04\x05\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x04\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x08\x0c\x04\x0c\x0c\x0e\x08\x0c\x0c\x0e\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x08\x03\x04\x05\x0c\x07\x08\x09\x0c\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x02\x03\x04\x0c\x06\x07\x08\x0c\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x08\x08\x0a\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x08\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x08\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x04\x06\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x04\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x04\x0c\x04\x05\x0c\x0d\x04\x05\x0c\x0d\x0c\x0d\x0d\x0f"
+    b"\x00\x01\x04\x03\x04\x05\x0c\x07\x04\x09\x0c\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x02\x03\x04\x05\x06\x07\x04\x05\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x04\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x08\x09\x04\x05\x06\x07\x08\x09\x09\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x08\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x04\x05\x04\x05\x05\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x04\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x01\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x04\x05\x04\x05\x05\x0d\x04\x0c\x05\x0d\x0c\x0d\x0d\x0f"
+    b"\x00\x01\x04\x03\x04\x05\x0c\x07\x04\x09\x0c\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x02\x03\x04\x05\x06\x07\x04\x0c\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x04\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x01\x09\x04\x05\x06\x07\x08\x09\x09\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x08\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x04\x05\x04\x05\x05\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x04\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x04\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x01\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+    b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f"
+)
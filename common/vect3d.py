@@ -1,5 +1,39 @@
 # MIT license; Copyright (c) 2023 Ondrej Sienczak
-def dominates(v):
-    a = abs(v[0]), abs(v[1]), abs(v[2])
-    i = a.index(max(a))
-    return i, 1 - 2 * (v[i] < 0)
+def dominant(v) -> int:
+    """Get dominant axis of vector without allocation.
+
+    :param v:    Vector
+
+    :return:    Index of dominant axis increased by one, negative when the
+                axis points to negative direction
+    """
+    x, y, z = abs(v[0]), abs(v[1]), abs(v[2])
+    if x >= y and x >= z:
+        i = 0
+    elif y >= z:
+        i = 1
+    else:
+        i = 2
+    return -i - 1 if v[i] < 0 else i + 1
+
+
+def dominant_hyst(v, last: int, margin: int) -> int:
+    """Get dominant axis of vector with hysteresis.
+
+    Dominant axis changes only when new one exceeds projection of vector to
+    last one at least by margin. So vector jittering around boundary of two
+    axes (45 degrees) does not flip result back and forth.
+
+    :param v:         Vector
+    :param last:      Last dominant axis (see `dominant`, 0 when unknown)
+    :param margin:    Hysteresis margin
+
+    :return:    Index of dominant axis increased by one, negative when the
+                axis points to negative direction
+    """
+    d = dominant(v)
+    if last and d != last:
+        a = v[last - 1] if last > 0 else -v[-last - 1]
+        if abs(v[(d if d > 0 else -d) - 1]) - a < margin:
+            return last
+    return d
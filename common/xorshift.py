@@ -0,0 +1,46 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+from random import getrandbits
+from config import RNG_SEED
+
+
+class XorShift:
+    """Seedable pseudo random generator.
+
+    16 bits xorshift generator (shifts 7, 9, 8) with period 65535. The whole
+    state fits to small integer, so generating of random bits does not allocate
+    memory on device. Generator provides subset of :mod:`random` interface, so
+    it can be used instead of it.
+
+    :param seed:    Initial seed (random when ``None``)
+    """
+
+    def __init__(self, seed: int = None):
+        self._x = 1
+        self.seed(seed)
+
+    def seed(self, seed: int = None) -> None:
+        """Restart generator from given seed.
+
+        :param seed:    Seed (random when ``None``)
+        """
+        if seed is None:
+            seed = getrandbits(16)
+        self._x = (seed & 0xFFFF) or 1
+
+    def getrandbits(self, n: int) -> int:
+        """Get random integer with ``n`` random bits (up to 16).
+
+        :param n:    Count of random bits
+
+        :return:    Random integer
+        """
+        x = self._x
+        x ^= (x << 7) & 0xFFFF
+        x ^= x >> 9
+        x ^= (x << 8) & 0xFFFF
+        self._x = x
+        return x >> (16 - n)
+
+
+# Generator shared by application
+rng = XorShift(RNG_SEED)
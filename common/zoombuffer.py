@@ -0,0 +1,83 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+from .matrixbuffer import MatrixBuffer
+
+
+# Zoom tables shared by buffers of the same scale
+_tables = dict()
+
+
+def _table(scale: int) -> bytearray:
+    """Get table of bytes zoomed by scale (``scale`` bytes for each byte value)."""
+    t = _tables.get(scale)
+    if t is None:
+        t = bytearray(256 * scale)
+        for v in range(256):
+            e = 0
+            for b in range(8):
+                e <<= scale
+                if v & (0x80 >> b):
+                    e |= (1 << scale) - 1
+            for i in range(scale):
+                t[v * scale + i] = (e >> (8 * (scale - 1 - i))) & 0xFF
+        _tables[scale] = t
+    return t
+
+
+class ZoomBuffer(MatrixBuffer):
+    """Display buffer showing 8x8 bitmaps over display made of more modules.
+
+    Glyphs, clock faces and transitions are composed as 8x8 bitmaps. Buffer
+    zooms them by the largest integer scale fitting the display and centers
+    them (on whole bytes), so they fill displays tiled from 4, 8 or 16 modules.
+    Zoom is done by table lookup per row byte, so loading of bitmap does not
+    allocate any heap.
+
+    :param width:    Display width
+    :param height:   Display height
+    """
+
+    def __init__(self, width: int = 8, height: int = 8):
+        super().__init__(width, height)
+        scale = min(width, height) // 8
+        self._scale = scale
+        self._bitmap = bytearray(8)
+        self._map = bytearray(len(self.rows))
+        self._origin = ((height - 8 * scale) // 2) * self._stride + (
+            self._stride - scale
+        ) // 2
+        self._zoom = _table(scale) if scale > 1 else None
+
+    @property
+    def bitmap(self) -> bytearray:
+        """Last loaded 8x8 bitmap (row by row in ``MONO_HLSB`` format)."""
+        return self._bitmap
+
+    def load(self, rows: bytes) -> None:
+        """Load 8x8 bitmap zoomed over whole display.
+
+        :param rows:    Bitmap (8 rows in ``MONO_HLSB`` format).
+        """
+        self._bitmap[:] = rows
+
+        if self._zoom is None and len(self._map) == 8:
+            super().load(rows)
+            return
+
+        scale = self._scale
+        zoom = self._zoom
+        m = self._map
+        stride = self._stride
+        o = self._origin
+
+        for r in range(8):
+            v = rows[r]
+            for _ in range(scale):
+                if zoom is None:
+                    m[o] = v
+                else:
+                    t = v * scale
+                    for i in range(scale):
+                        m[o + i] = zoom[t + i]
+                o += stride
+
+        super().load(m)
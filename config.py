@@ -10,6 +10,9 @@ TIME_ZONE_HOURS = 2
 # Time bright time range in hours
 CLOCK_BRIGHT_TIME = 7, 20
 
+# Frame period in milliseconds of clock face fade when time changes
+CLOCK_FADE = 40
+
 # NTP servers to be used for time synchronization
 NTP_SERVER = ("0.cz.pool.ntp.org",)
 
@@ -28,6 +31,17 @@ DIMM_TIME = 30
 # Time in seconds when display will switch to screen saver mode
 SAVER_TIME = 120
 
+# Minimal period in milliseconds between two display refreshes (frames drawn
+# meanwhile are merged together)
+DISPLAY_PERIOD = 10
+
+# Seed of random generator used by animations (None for random seed).
+# Fixed seed makes animations reproducible.
+RNG_SEED = None
+
+# Report heap allocations per frame of application tasks
+HEAP_DEBUG = False
+
 # Compensation of measured accelerations
 ACC_COMPENSATE = -10, 29, 69
 
@@ -37,7 +51,43 @@ ACC_COMPENSATE = -10, 29, 69
 # if value is positive or negative.
 ACC_TRANSFORM = 2, -1, -3
 
+# Low-pass filter of accelerometer samples - each sample moves filtered value
+# by 1 / 2 ** ACC_FILTER of difference (0 disables filter)
+ACC_FILTER = 2
+
+# Hysteresis of dominant axis (in accelerometer units - 256 per 1 g), so jitter
+# around 45 degrees does not flip position back and forth
+ACC_HYSTERESIS = 64
+
+# Accelerometer sample rate in Hz when no task needs faster sampling
+ACC_LOW_RATE = 25
+
+# Thresholds of accelerometer activity and inactivity (in 62.5 mg units) and time
+# in seconds of inactivity after which accelerometer task sleeps till next motion
+# (used only when PIN_INT is connected)
+ACC_ACTIVITY = 4
+ACC_INACTIVITY = 2
+ACC_INACT_TIME = 30
+
+# File where raw accelerometer samples are recorded (None disables recording).
+# Records can be replayed in emulation, e.g. HOURGLASS_REPLAY=acc.rec python3 main.py
+ACC_RECORD = None
+
+# Maximal size of record in bytes (recording stops when record is full)
+ACC_RECORD_SIZE = 65536
+
 # Follows HW configuration
 PIN_SDA = 5
 PIN_SCL = 4
 SPI_ID = 1
+PIN_CS = 15
+PIN_INT = None  # Accelerometer INT1 (None when not connected)
+
+# Display modules in order of chain. Each module shows 8x8 tile of one of hourglass
+# halves - tuple of half index, tile column, tile row and module rotation (count of
+# 90 degrees clockwise turns). E.g. two halves made of 2x2 modules each:
+# DISPLAY_TILES = (
+#     (0, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0), (0, 1, 1, 0),
+#     (1, 0, 0, 0), (1, 1, 0, 0), (1, 0, 1, 0), (1, 1, 1, 0),
+# )
+DISPLAY_TILES = (0, 0, 0, 0), (1, 0, 0, 0)
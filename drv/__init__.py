@@ -1,10 +1,11 @@
 # MIT license; Copyright (c) 2023 Ondrej Sienczak
 from machine import Pin, SPI, I2C
-from config import PIN_SDA, PIN_SCL, SPI_ID
+from config import PIN_SDA, PIN_SCL, SPI_ID, PIN_CS, DISPLAY_TILES
 from .max7219 import Matrix8x8  # Initialize display as early as possible
+from .tiles import Tiles
 
 spi = SPI(SPI_ID, baudrate=10000000)
-display = Matrix8x8(spi, 15, 2)
+display = Tiles(Matrix8x8(spi, PIN_CS, len(DISPLAY_TILES)), DISPLAY_TILES)
 
 from .adxl345 import Adxl345  # Continue by importing of accelerometer
 
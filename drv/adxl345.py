@@ -7,32 +7,147 @@ from micropython import const
 OFSX = const(0x1E)
 OFSY = const(0x1F)
 OFSZ = const(0x20)
+THRESH_ACT = const(0x24)
+THRESH_INACT = const(0x25)
+TIME_INACT = const(0x26)
+ACT_INACT_CTL = const(0x27)
 BW_RATE = const(0x2C)
 POWER_CTL = const(0x2D)
 INT_ENABLE = const(0x2E)
+INT_MAP = const(0x2F)
+INT_SOURCE = const(0x30)
 DATA_FORMAT = const(0x31)
 REG_ACC = const(0x32)
+FIFO_CTL = const(0x38)
+FIFO_STATUS = const(0x39)
+
+FIFO_BYPASS = const(0x00)
+FIFO_FIFO = const(0x40)
+FIFO_STREAM = const(0x80)
+FIFO_TRIGGER = const(0xC0)
+FIFO_SIZE = const(32)
+
+INT_ACTIVITY = const(0x10)
+INT_INACTIVITY = const(0x08)
 
 
 class Adxl345:
+    """ADXL345 accelerometer driver.
+
+    Chip measures continuously and collects samples in its FIFO (stream mode),
+    so samples can be read in batches by `drain` (see :attr:`samples`).
+
+    :param i2c:     I2C bus
+    :param addr:    Chip address
+    """
+
     def __init__(self, i2c: I2C, addr: int = 0x53):
         self._addr = addr
         self._i2c = i2c
         self._buff = bytearray(6)
         self._regb = bytearray(1)
+        self.samples = bytearray(FIFO_SIZE * 6)
+        self._views = tuple(
+            [memoryview(self.samples)[i * 6 : i * 6 + 6] for i in range(FIFO_SIZE)]
+        )
+        self.period = 10  # Sample period [ms]
 
-        self._wrm(DATA_FORMAT, 0x2B)  # Full range
-        self._wrm(BW_RATE, 0x0C)  # BW_RATE_50HZ
+        self._wrm(DATA_FORMAT, 0x2B)  # Full range, interrupts active low
+        self.rate(100)
         self._wrm(INT_ENABLE, 0)  # Disable interrupt
         self._wrm(OFSX, 0)  # Set ACC offsets
         self._wrm(OFSY, 0)
         self._wrm(OFSZ, 0)
+        self.fifo(FIFO_STREAM)
         self._wrm(POWER_CTL, 0x28)  # MEASURE continuously
 
     def acc(self):
         self._i2c.readfrom_mem_into(self._addr, REG_ACC, self._buff)
         return unpack("<hhh", self._buff)
 
+    def rate(self, hz: int) -> None:
+        """Set output data rate.
+
+        Rate is rounded up to nearest rate supported by chip (from 6.25 Hz up to
+        400 Hz, where each one doubles previous one). Then :attr:`period` is set
+        to period of samples in milliseconds.
+
+        :param hz:    Requested rate
+        """
+        code = 0x06  # 6.25 Hz
+        while code < 0x0C and (3200 >> (15 - code)) < hz:
+            code += 1
+        self._wrm(BW_RATE, code)
+        self.period = 10240 >> code
+
+    def fifo(self, mode: int, samples: int = FIFO_SIZE // 2) -> None:
+        """Configure FIFO.
+
+        :param mode:       One of ``FIFO_BYPASS``, ``FIFO_FIFO``, ``FIFO_STREAM``
+                           or ``FIFO_TRIGGER``
+        :param samples:    Count of samples triggering watermark interrupt
+                           (samples kept before trigger event in trigger mode)
+        """
+        self._wrm(FIFO_CTL, mode | (samples & 0x1F))
+
+    def drain(self) -> int:
+        """Read all samples collected in FIFO into :attr:`samples`.
+
+        Chip pops one FIFO entry per each read of data registers, where multi byte
+        read continues beyond data registers to FIFO registers. So each entry is
+        read by its own 6 bytes transaction, but all of them are read at once
+        into preallocated buffers without any heap allocation.
+
+        :return:    Count of samples read (oldest sample first)
+        """
+        i2c = self._i2c
+        addr = self._addr
+        i2c.readfrom_mem_into(addr, FIFO_STATUS, self._regb)
+        n = min(self._regb[0] & 0x3F, FIFO_SIZE)
+        views = self._views
+        for i in range(n):
+            i2c.readfrom_mem_into(addr, REG_ACC, views[i])
+        return n
+
+    def sample_into(self, i: int, v: list) -> None:
+        """Decode acceleration of sample read by `drain`.
+
+        :param i:    Sample index
+        :param v:    List where X, Y and Z acceleration is stored
+        """
+        b = self.samples
+        o = i * 6
+        for j in range(o, o + 6, 2):
+            a = b[j] | b[j + 1] << 8
+            v[(j - o) >> 1] = a - 0x10000 if a & 0x8000 else a
+
+    def motion(self, activity: int, inactivity: int, time: int) -> None:
+        """Enable activity and inactivity interrupts on INT1 pin.
+
+        Detection is AC coupled on all axes, so it reacts on change of position
+        rather than on position itself. As measurement is linked, activity is
+        reported only after inactivity and vice versa. Interrupt pin is held
+        low till interrupts are read by `interrupts`.
+
+        :param activity:      Activity threshold (62.5 mg/LSB)
+        :param inactivity:    Inactivity threshold (62.5 mg/LSB)
+        :param time:          Time in seconds of inactivity to be reported
+        """
+        self._wrm(THRESH_ACT, activity)
+        self._wrm(THRESH_INACT, inactivity)
+        self._wrm(TIME_INACT, time)
+        self._wrm(ACT_INACT_CTL, 0xFF)
+        self._wrm(INT_MAP, 0)  # All interrupts to INT1
+        self._wrm(INT_ENABLE, INT_ACTIVITY | INT_INACTIVITY)
+
+    def interrupts(self) -> int:
+        """Read and clear interrupts.
+
+        :return:    Mask of interrupts which occurred (``INT_ACTIVITY``, ...)
+        """
+        self._i2c.readfrom_mem_into(self._addr, INT_SOURCE, self._regb)
+        return self._regb[0]
+
     def compensate(self, x: int, y: int, z: int) -> None:
         self._wrm(OFSX, max(round(x / 8), 0))  # Set ACC offsets
         self._wrm(OFSY, max(round(y / 8), 0))
@@ -4,6 +4,7 @@ from micropython import const
 from machine import SPI
 
 
+_NOOP = const(0)
 _DIGIT0 = const(1)
 _DECODEMODE = const(9)
 _INTENSITY = const(10)
@@ -13,11 +14,21 @@ _DISPLAYTEST = const(15)
 
 
 class Matrix8x8:
+    """Chain of MAX7219 driven 8x8 LED matrices.
+
+    Commands for all modules in chain are assembled in one preallocated buffer
+    and sent by single SPI transfer inside each chip select frame.
+
+    :param spi:    SPI bus
+    :param cs:     Chip select pin
+    :param cnt:    Count of modules in chain
+    """
+
     def __init__(self, spi: SPI, cs: int, cnt: int = 1):
         self._cs = NSsPin(cs)
         self._active = True
         self._spi = spi
-        self._cmd = bytearray(2)
+        self._cmd = bytearray(2 * cnt)
         self._cnt = cnt
         self._bright = -1
 
@@ -35,24 +46,10 @@ class Matrix8x8:
         self.brightness = 0
 
         # Clean up displays
-        self._cmd[1] = 255
-        self._cmd[0] = _DIGIT0
-        with self._cs:
-            for i in range(self._cnt):
-                self._spi.write(self._cmd)
-
-        self._cmd[1] = 129
+        self._write(_DIGIT0, 255)
         for row in range(1, 7):
-            self._cmd[0] = _DIGIT0 + row
-            with self._cs:
-                for i in range(self._cnt):
-                    self._spi.write(self._cmd)
-
-        self._cmd[1] = 255
-        self._cmd[0] = _DIGIT0 + 7
-        with self._cs:
-            for i in range(self._cnt):
-                self._spi.write(self._cmd)
+            self._write(_DIGIT0 + row, 129)
+        self._write(_DIGIT0 + 7, 255)
 
     @property
     def brightness(self) -> int:
@@ -75,33 +72,48 @@ class Matrix8x8:
             self._active = value
             self._write(_SHUTDOWN, 1 if value else 0)
 
-    def show(self, *args: "MatrixBuffer") -> None:
+    def show(self, buffs: tuple) -> None:
+        """Show rows of frame buffers changed since last show.
+
+        Only dirty rows are sent, each row of whole chain in one SPI transfer.
+        Modules which row has not changed in chain receive no-operation command
+        instead. Rows are marked as clean then.
+
+        :param buffs:    Frame buffers (one for each module)
+        """
         if not self._active:
             return
 
-        def choose_odd(n: int) -> bool:
-            return n[0] % 2
+        cnt = self._cnt
+        dirty = 0
+        for i in range(cnt):
+            dirty |= buffs[i].dirty
 
+        cmd = self._cmd
         for row in range(8):
-
-            def choose_row(n: tuple[int, list[int, ...]]) -> int:
-                return n[1].buffs[1][row]
-
-            self._cmd[0] = _DIGIT0 + row
-            mask = sum(map(choose_row, filter(choose_odd, enumerate(args))))
+            if not dirty & (1 << row):
+                continue
+
+            for i in range(cnt):
+                b = buffs[i]
+                if b.dirty & (1 << row):
+                    cmd[2 * i] = _DIGIT0 + row
+                    cmd[2 * i + 1] = b.rows[row]
+                else:
+                    cmd[2 * i] = _NOOP
+                    cmd[2 * i + 1] = 0
 
             with self._cs:
-                for i in range(self._cnt):
-                    pixels = args[i].buffs[0]
+                self._spi.write(cmd)
 
-                    if True or mask:
-                        self._cmd[1] = pixels[row]
-                        self._spi.write(self._cmd)
+        for i in range(cnt):
+            buffs[i].clean()
 
     def _write(self, reg: int, value: int) -> None:
-        self._cmd[0] = reg
-        self._cmd[1] = value
+        cmd = self._cmd
+        for i in range(0, len(cmd), 2):
+            cmd[i] = reg
+            cmd[i + 1] = value
 
         with self._cs:
-            for _ in range(self._cnt):
-                self._spi.write(self._cmd)
+            self._spi.write(cmd)
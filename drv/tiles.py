@@ -0,0 +1,189 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+from .max7219 import Matrix8x8
+from micropython import const
+
+
+ROT_0 = const(0)
+ROT_90 = const(1)
+ROT_180 = const(2)
+ROT_270 = const(3)
+
+# Byte with bits in reversed order
+_REVERSE = bytes(
+    [sum([((i >> b) & 1) << (7 - b) for b in range(8)]) for i in range(256)]
+)
+
+
+class _Tile:
+    """Rows of one module composed from display buffer.
+
+    Provides the same interface as display buffer, so tiles can be shown
+    by :meth:`Matrix8x8.show`.
+    """
+
+    def __init__(self):
+        self.rows = bytearray(8)
+        self.dirty = 0
+
+    def clean(self) -> None:
+        self.dirty = 0
+
+
+class Tiles:
+    """Display buffers tiled over chain of 8x8 modules.
+
+    Each module in chain shows 8x8 tile of one of display buffers. Tile of module
+    is described by tuple containing index of display buffer, column and row of tile
+    in display buffer and rotation of module (count of 90 degrees clockwise turns).
+    Routing of modules is stored in tables when tiles are configured, so show
+    just copies dirty rows of tiles to modules. Rotated modules get table holding
+    source row and bit of tile for each bit of module rows.
+
+    Modules outside of smaller display buffer are kept dark (they are repainted
+    when buffer is forced to be repainted, see :attr:`MatrixBuffer.forced`).
+
+    When each display buffer is shown by one module in chain order without rotation,
+    then buffers are shown by modules directly.
+
+    :param matrix:    Chain of modules
+    :param tiles:     Tiles of modules (in chain order)
+    """
+
+    def __init__(self, matrix: Matrix8x8, tiles: tuple):
+        self._matrix = matrix
+        self._buff = bytearray([t[0] for t in tiles])
+        self._col = bytearray([t[1] for t in tiles])
+        self._row = bytearray([t[2] for t in tiles])
+        self._rot = bytearray([t[3] % 4 for t in tiles])
+        self._tiles = tuple([_Tile() for _ in tiles])
+        self._routes = tuple([Tiles._routing(t[3] % 4) for t in tiles])
+        self._direct = all([tuple(t) == (i, 0, 0, 0) for i, t in enumerate(tiles)])
+        self._sizes = tuple(
+            [
+                (
+                    max([t[1] for t in tiles if t[0] == b]) * 8 + 8,
+                    max([t[2] for t in tiles if t[0] == b]) * 8 + 8,
+                )
+                for b in range(max(self._buff) + 1)
+            ]
+        )
+
+    @staticmethod
+    def _routing(rot: int) -> bytes:
+        """Compose routing table of rotated module.
+
+        :param rot:    Rotation of module
+
+        :return:    Source row and bit mask of tile for each bit of module rows
+                    (``None`` when module is not rotated by 90 degrees)
+        """
+        if rot != ROT_90 and rot != ROT_270:
+            return None
+
+        route = bytearray(128)
+        i = 0
+        for r in range(8):
+            for b in range(8):
+                # Bit ``0x80 >> b`` of module row ``r``
+                if rot == ROT_90:
+                    route[i], route[i + 1] = 7 - b, 0x80 >> r
+                else:
+                    route[i], route[i + 1] = b, 1 << r
+                i += 2
+        return bytes(route)
+
+    def size(self, i: int) -> tuple[int, int]:
+        """Get size of display buffer covering all its tiles.
+
+        :param i:    Index of display buffer
+
+        :return:    Width and height
+        """
+        return self._sizes[i]
+
+    @property
+    def brightness(self) -> int:
+        return self._matrix.brightness
+
+    @brightness.setter
+    def brightness(self, value: int) -> None:
+        self._matrix.brightness = value
+
+    @property
+    def active(self) -> bool:
+        return self._matrix.active
+
+    @active.setter
+    def active(self, value: bool) -> None:
+        self._matrix.active = value
+
+    def show(self, buffs: tuple) -> None:
+        """Show rows of display buffers changed since last show.
+
+        :param buffs:    Display buffers
+        """
+        matrix = self._matrix
+        if self._direct:
+            matrix.show(buffs)
+            return
+
+        if not matrix.active:
+            return
+
+        for m in range(len(self._tiles)):
+            self._route(m, buffs[self._buff[m]])
+
+        matrix.show(self._tiles)
+
+        for i in range(len(buffs)):
+            buffs[i].clean()
+
+    def _route(self, m: int, buff) -> None:
+        """Compose rows of module from its tile of display buffer.
+
+        :param m:       Index of module in chain
+        :param buff:    Display buffer
+        """
+        tile = self._tiles[m]
+        rows = tile.rows
+        width, height = buff.size
+        x, y = self._col[m] * 8, self._row[m] * 8
+
+        if x >= width or y >= height:
+            # Buffer is smaller than tiling - keep module dark
+            if buff.forced:
+                for r in range(8):
+                    rows[r] = 0
+                tile.dirty = 0xFF
+            return
+
+        dirty = 0xFF if buff.forced else (buff.dirty >> y) & 0xFF
+        tile.dirty = dirty
+        if not dirty:
+            return
+
+        src = buff.rows
+        stride = (width + 7) // 8
+        o = y * stride + (x >> 3)
+        rot = self._rot[m]
+
+        if rot == ROT_0:
+            for r in range(8):
+                rows[r] = src[o + r * stride]
+        elif rot == ROT_180:
+            for r in range(8):
+                rows[r] = _REVERSE[src[o + (7 - r) * stride]]
+            tile.dirty = _REVERSE[dirty]
+        else:
+            # Columns of tile becomes rows of module
+            route = self._routes[m]
+            i = 0
+            for r in range(8):
+                v = 0
+                for b in range(8):
+                    if src[o + route[i] * stride] & route[i + 1]:
+                        v |= 0x80 >> b
+                    i += 2
+                rows[r] = v
+
+            tile.dirty = 0xFF
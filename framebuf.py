@@ -2,28 +2,107 @@
 
 from __future__ import annotations
 
-
-from itertools import product
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 MONO_HLSB = 1
 
+# Frames with at least this count of pixels are processed by NumPy (when available)
+_NP_PIXELS = 4096
+
+
+def _glyph(rows: str) -> bytes:
+    return bytes(int(r, 2) << 2 for r in rows.split()) + b"\x00"
+
+
+# Simple 5x7 font drawn in 8x8 cells (emulation has no built-in MicroPython font)
+_FONT = {
+    c: _glyph(g)
+    for c, g in {
+        " ": "00000 00000 00000 00000 00000 00000 00000",
+        "0": "01110 10001 10011 10101 11001 10001 01110",
+        "1": "00100 01100 00100 00100 00100 00100 01110",
+        "2": "01110 10001 00001 00010 00100 01000 11111",
+        "3": "11111 00010 00100 00010 00001 10001 01110",
+        "4": "00010 00110 01010 10010 11111 00010 00010",
+        "5": "11111 10000 11110 00001 00001 10001 01110",
+        "6": "00110 01000 10000 11110 10001 10001 01110",
+        "7": "11111 00001 00010 00100 01000 01000 01000",
+        "8": "01110 10001 10001 01110 10001 10001 01110",
+        "9": "01110 10001 10001 01111 00001 00010 01100",
+        "A": "01110 10001 10001 11111 10001 10001 10001",
+        "B": "11110 10001 10001 11110 10001 10001 11110",
+        "C": "01110 10001 10000 10000 10000 10001 01110",
+        "D": "11100 10010 10001 10001 10001 10010 11100",
+        "E": "11111 10000 10000 11110 10000 10000 11111",
+        "F": "11111 10000 10000 11110 10000 10000 10000",
+        "G": "01110 10001 10000 10111 10001 10001 01111",
+        "H": "10001 10001 10001 11111 10001 10001 10001",
+        "I": "01110 00100 00100 00100 00100 00100 01110",
+        "J": "00111 00010 00010 00010 00010 10010 01100",
+        "K": "10001 10010 10100 11000 10100 10010 10001",
+        "L": "10000 10000 10000 10000 10000 10000 11111",
+        "M": "10001 11011 10101 10101 10001 10001 10001",
+        "N": "10001 10001 11001 10101 10011 10001 10001",
+        "O": "01110 10001 10001 10001 10001 10001 01110",
+        "P": "11110 10001 10001 11110 10000 10000 10000",
+        "Q": "01110 10001 10001 10001 10101 10010 01101",
+        "R": "11110 10001 10001 11110 10100 10010 10001",
+        "S": "01111 10000 10000 01110 00001 00001 11110",
+        "T": "11111 00100 00100 00100 00100 00100 00100",
+        "U": "10001 10001 10001 10001 10001 10001 01110",
+        "V": "10001 10001 10001 10001 10001 01010 00100",
+        "W": "10001 10001 10001 10101 10101 10101 01010",
+        "X": "10001 10001 01010 00100 01010 10001 10001",
+        "Y": "10001 10001 10001 01010 00100 00100 00100",
+        "Z": "11111 00001 00010 00100 01000 10000 11111",
+        ".": "00000 00000 00000 00000 00000 01100 01100",
+        ",": "00000 00000 00000 00000 01100 00100 01000",
+        ":": "00000 01100 01100 00000 01100 01100 00000",
+        "-": "00000 00000 00000 11111 00000 00000 00000",
+        "+": "00000 00100 00100 11111 00100 00100 00000",
+        "=": "00000 00000 11111 00000 11111 00000 00000",
+        "!": "00100 00100 00100 00100 00100 00000 00100",
+        "?": "01110 10001 00001 00010 00100 00000 00100",
+        "/": "00000 00001 00010 00100 01000 10000 00000",
+        "%": "11000 11001 00010 00100 01000 10011 00011",
+        "(": "00010 00100 01000 01000 01000 00100 00010",
+        ")": "01000 00100 00010 00010 00010 00100 01000",
+        "'": "00100 00100 01000 00000 00000 00000 00000",
+        "_": "00000 00000 00000 00000 00000 00000 11111",
+    }.items()
+}
+_UNKNOWN = _glyph("11111 10001 10001 10001 10001 10001 11111")
+
 
 class FrameBuffer:
-    def __init__(self, buf: bytearray, width: int, height: int, mode: int):
+    """Emulation of MicroPython ``FrameBuffer`` (``MONO_HLSB`` format only).
+
+    Each row of pixels is processed as one integer (pixel 0 is the most significant
+    bit), so operations work on whole bytes by shifts and masks instead of visiting
+    pixels one by one. Large frames are processed by NumPy when it is installed.
+    """
+
+    def __init__(
+        self, buf: bytearray, width: int, height: int, mode: int, stride: int = None
+    ):
         self._buf = buf
         self._width = width
-        self._rwidth = ((width + 7) // 8) * 8
         self._height = height
         self._mode = mode
+        self._bpr = ((width if stride is None else stride) + 7) // 8
+        self._rwidth = self._bpr * 8
         assert mode == MONO_HLSB, "Only MONO_HLSB supported in simulation!"
 
     def pixel(self, x: int, y: int, val: int = None) -> int:
         if x < 0 or x >= self._width or y < 0 or y >= self._height:
             return 0
 
-        i, r = divmod((y * self._rwidth + x), 8)
-        r = 7 - r
+        i = y * self._bpr + (x >> 3)
+        r = 7 - (x & 7)
         m = 1 << r
 
         if val is not None:
@@ -35,8 +114,148 @@ class FrameBuffer:
         else:
             return (self._buf[i] >> r) & 1
 
+    def fill(self, c: int) -> None:
+        if self._width == self._rwidth:
+            n = self._bpr * self._height
+            self._buf[:n] = (b"\xff" if c else b"\x00") * n
+        else:
+            self.fill_rect(0, 0, self._width, self._height, c)
+
+    def fill_rect(self, x: int, y: int, w: int, h: int, c: int) -> None:
+        m = self._span(x, w)
+        if not m:
+            return
+
+        for yy in range(max(0, y), min(self._height, y + h)):
+            r = self._row(yy)
+            self._store(yy, r | m if c else r & ~m)
+
+    def hline(self, x: int, y: int, w: int, c: int) -> None:
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x: int, y: int, h: int, c: int) -> None:
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x: int, y: int, w: int, h: int, c: int, f: bool = False) -> None:
+        if f:
+            self.fill_rect(x, y, w, h, c)
+        else:
+            self.fill_rect(x, y, w, 1, c)
+            self.fill_rect(x, y + h - 1, w, 1, c)
+            self.fill_rect(x, y, 1, h, c)
+            self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1: int, y1: int, x2: int, y2: int, c: int) -> None:
+        dx, dy = abs(x2 - x1), -abs(y2 - y1)
+        sx, sy = 1 if x1 < x2 else -1, 1 if y1 < y2 else -1
+        e = dx + dy
+
+        while True:
+            self.pixel(x1, y1, c)
+            if x1 == x2 and y1 == y2:
+                break
+            e2 = 2 * e
+            if e2 >= dy:
+                e += dy
+                x1 += sx
+            if e2 <= dx:
+                e += dx
+                y1 += sy
+
     def blit(self, fbuf: FrameBuffer, x: int, y: int, key: int = -1) -> None:
-        for yy, xx in product(range(fbuf._width), range(fbuf._height)):
-            p = fbuf.pixel(xx, yy)
-            if p != key:
-                self.pixel(xx + x, yy + y, p)
+        w = fbuf._width
+        m = self._span(x, w)
+        if not m:
+            return
+
+        if np is not None and self._width * self._height >= _NP_PIXELS:
+            self._np_blit(fbuf, x, y, key)
+            return
+
+        # Align source row (pixel 0 in MSB) to destination position
+        shift = self._rwidth - w - x
+        sshift = fbuf._rwidth - w
+        ys = range(max(0, -y), min(fbuf._height, self._height - y))
+        rows = [fbuf._row(sy) >> sshift for sy in ys]
+
+        for sy, s in zip(ys, rows):
+            s = (s << shift if shift >= 0 else s >> -shift) & m
+            r = self._row(y + sy)
+            if key == 0:
+                r |= s
+            elif key == 1:
+                r &= ~(m & ~s)
+            else:
+                r = (r & ~m) | s
+            self._store(y + sy, r)
+
+    def scroll(self, xstep: int, ystep: int) -> None:
+        # Pixels not covered by scrolled content are left unchanged
+        if xstep >= 0:
+            m = self._span(xstep, self._width - xstep)
+        else:
+            m = self._span(0, self._width + xstep)
+
+        if ystep > 0:
+            ys = range(self._height - 1, ystep - 1, -1)
+        else:
+            ys = range(0, self._height + ystep)
+
+        for y in ys:
+            s = self._row(y - ystep)
+            s = (s >> xstep if xstep >= 0 else s << -xstep) & m
+            self._store(y, (self._row(y) & ~m) | s)
+
+    def text(self, s: str, x: int, y: int, c: int = 1) -> None:
+        for ch in s:
+            glyph = _FONT.get(ch.upper(), _UNKNOWN)
+            m = self._span(x, 8)
+            shift = self._rwidth - 8 - x
+
+            if m:
+                for gy in range(max(0, -y), min(8, self._height - y)):
+                    g = glyph[gy]
+                    g = (g << shift if shift >= 0 else g >> -shift) & m
+                    if g:
+                        r = self._row(y + gy)
+                        self._store(y + gy, r | g if c else r & ~g)
+
+            x += 8
+
+    def _row(self, y: int) -> int:
+        o = y * self._bpr
+        return int.from_bytes(self._buf[o : o + self._bpr], "big")
+
+    def _store(self, y: int, r: int) -> None:
+        o = y * self._bpr
+        self._buf[o : o + self._bpr] = r.to_bytes(self._bpr, "big")
+
+    def _span(self, x: int, w: int) -> int:
+        """Mask of row bits of pixels from x to x + w clipped to frame."""
+        x0, x1 = max(0, x), min(self._width, x + w)
+        if x1 <= x0:
+            return 0
+        return ((1 << (x1 - x0)) - 1) << (self._rwidth - x1)
+
+    def _bits(self) -> np.ndarray:
+        b = np.frombuffer(self._buf, dtype=np.uint8, count=self._bpr * self._height)
+        return np.unpackbits(b.reshape(self._height, self._bpr), axis=1)
+
+    def _np_blit(self, fbuf: FrameBuffer, x: int, y: int, key: int) -> None:
+        src = fbuf._bits()[:, : fbuf._width]
+        dst = self._bits()
+
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self._width, x + fbuf._width), min(self._height, y + fbuf._height)
+        if x1 <= x0 or y1 <= y0:
+            return
+
+        s = src[y0 - y : y1 - y, x0 - x : x1 - x]
+        d = dst[y0:y1, x0:x1]
+        if key == 0 or key == 1:
+            np.copyto(d, s, where=s != key)
+        else:
+            d[:] = s
+
+        n = self._bpr * self._height
+        self._buf[:n] = np.packbits(dst, axis=1).tobytes()
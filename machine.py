@@ -1,12 +1,21 @@
 # Emulation
 
-import pygame
+from common.accrec import batches
 from common.glyphs import glyphs_clock
+from config import DISPLAY_TILES
 from datetime import datetime
 from framebuf import FrameBuffer, MONO_HLSB
 from itertools import product
 from struct import pack
-from os import _exit as exit
+from os import _exit as exit, environ
+from time import time
+from asyncio import get_running_loop
+
+try:
+    import pygame
+except ImportError:
+    # Headless emulation (benchmarks) - nothing is drawn
+    pygame = None
 
 
 class RTC:
@@ -26,16 +35,33 @@ class RTC:
 
 
 class Pin:
+    # Pins with interrupt handlers (interrupts are raised by emulated peripherals)
+    _irqs = list()
+
     def __init__(self, pin: int, mode: int = 2, value: int = 0):
         self._value = value
+        self._handler = None
 
     def value(self, value: int = None) -> int:
         if value is not None:
             self._value = value
         return self._value
 
+    def irq(self, handler=None, trigger: int = 1) -> None:
+        self._handler = handler
+        if self not in self._irqs:
+            self._irqs.append(self)
+
+    @classmethod
+    def _raise(cls) -> None:
+        for pin in cls._irqs:
+            if pin._handler is not None:
+                pin._handler(pin)
+
     OUT = 1
     IN = 2
+    IRQ_FALLING = 1
+    IRQ_RISING = 2
 
 
 class SPI:
@@ -44,30 +70,44 @@ class SPI:
     _radius = _dsize / 20
     _step = _dsize / 8
     _step2 = _step / 2
-    _buffs = tuple([bytearray(8) for _ in range(3)])
+
+    # One buffer for each module in chain and one for clock face editing
+    _buffs = tuple([bytearray(8) for _ in range(len(DISPLAY_TILES) + 1)])
 
     def __init__(self, idx: int, baudrate: int):
         cls = type(self)
 
-        self._last = -1
+        self._module = 0
         self._intesity = 0
 
-        self._screen = pygame.display.set_mode(self._dim)
-        self._clock = pygame.time.Clock()
-
         cls._pixels = tuple(
             [
                 FrameBuffer(self._buffs[i], 8, 8, MONO_HLSB)
                 for i in range(len(self._buffs))
             ]
         )
-        self._pixels[2].blit(glyphs_clock[1], 0, 0)
+        self._pixels[-1].blit(glyphs_clock[1], 0, 0)
+
+        if pygame is None:
+            return
+
+        # Halves of hourglass are drawn as square of modules tiles
+        halves = max([t[0] for t in DISPLAY_TILES]) + 1
+        self._tiles = max([max(t[1], t[2]) for t in DISPLAY_TILES]) + 1
+        size = self._dsize * self._tiles
+        self._scale = self._tiles * self._dim[0] / 200
+        dim = round(self._dim[0] * self._scale), round(
+            self._dim[0] * (1 + halves) * self._scale
+        )
 
-        self._raw = tuple([bytearray(self._dsize * self._dsize * 3) for i in range(2)])
+        self._screen = pygame.display.set_mode(dim)
+        self._clock = pygame.time.Clock()
+
+        self._raw = tuple([bytearray(size * size * 3) for i in range(halves)])
         self._display = tuple(
             [
-                pygame.image.frombuffer(self._raw[i], (self._dsize, self._dsize), "RGB")
-                for i in range(2)
+                pygame.image.frombuffer(self._raw[i], (size, size), "RGB")
+                for i in range(halves)
             ]
         )
 
@@ -76,41 +116,52 @@ class SPI:
         self._display_draw()
 
     def write(self, data: bytes) -> None:
-        if data[0] in range(1, 9):
-            if self._last == data[0]:
-                self._buffs[1][data[0] - 1] = data[1]
-            else:
-                self._buffs[0][data[0] - 1] = data[1]
-                self._last = data[0]
-        elif data[0] == 10:
-            self._intesity = data[1]
+        # Each command goes to next module in chain (no-op commands are skipped)
+        for i in range(0, len(data), 2):
+            reg, value = data[i], data[i + 1]
+            module = self._module
+            self._module = (module + 1) % len(DISPLAY_TILES)
+
+            if reg in range(1, 9):
+                self._buffs[module][reg - 1] = value
+            elif reg == 10:
+                self._intesity = value
 
         self._display_draw()
 
     def _display_draw(self):
+        if pygame is None:
+            return
+
         clmax = (self._intesity * 10) + 105
 
         for y, x in product(range(8), range(8)):
             pygame.draw.circle(
                 self._screen,
-                (0, 0, 180 if self._pixels[2].pixel(x, y) else 64),
+                (0, 0, 180 if self._pixels[-1].pixel(x, y) else 64),
                 (self._step2 + self._step * x, self._step2 + self._step * y),
                 self._radius,
             )
 
-        for display, pixels in zip(self._display, self._pixels):
+        for (half, col, row, rot), pixels in zip(DISPLAY_TILES, self._pixels):
             for y, x in product(range(8), range(8)):
+                # Pixel of module shown in position of its tile
+                tx, ty = ((x, y), (y, 7 - x), (7 - x, 7 - y), (7 - y, x))[rot % 4]
                 pygame.draw.circle(
-                    display,
+                    self._display[half],
                     (0, clmax if pixels.pixel(x, y) else 16, 0),
-                    (self._step2 + self._step * x, self._step2 + self._step * y),
+                    (
+                        self._step2 + self._step * (tx + col * 8),
+                        self._step2 + self._step * (ty + row * 8),
+                    ),
                     self._radius,
                 )
 
-        for i, display in zip(range(2), self._display):
+        for i, display in enumerate(self._display):
             rotated_image = pygame.transform.rotate(display, 225)
             self._screen.blit(
-                rotated_image, (0, self._dim[1] - self._dim[0] * 2 + i * self._dim[0])
+                rotated_image,
+                (0, round((self._dim[0] + i * self._dim[0]) * self._scale)),
             )
 
         pygame.display.flip()
@@ -118,16 +169,59 @@ class SPI:
 
 
 class I2C:
+    _THRESH_ACT = 0x24
+    _TIME_INACT = 0x26
+    _BW_RATE = 0x2C
+    _INT_ENABLE = 0x2E
+    _INT_SOURCE = 0x30
+    _FIFO_STATUS = 0x39
+    _ACTIVITY = 0x10
+    _INACTIVITY = 0x08
+
     def __init__(self, scl: Pin, sda: Pin, freq: int):
         self._acc = 0, 0, 1000
+        self._rate = 100
+        self._sampled = time()
+        self._regs = bytearray(0x40)
+        self._moved = time()
+        self._active = True
+        self._still = 0
+        self._polling = False
 
     def writeto_mem(self, addr: int, reg: int, data: bytes) -> None:
-        ...
+        self._regs[reg] = data[0]
+        if reg == self._BW_RATE:
+            self._rate = 3200 / 2 ** (15 - (data[0] & 0x0F))
 
     def readfrom_mem_into(self, addr: int, reg: int, buff: bytearray) -> None:
-        events = pygame.event.get()
+        self._events()
+
+        buff = memoryview(buff)
+        if reg == self._FIFO_STATUS:
+            # Samples collected in FIFO since last drain (constant acceleration)
+            now = time()
+            n = int((now - self._sampled) * self._rate)
+            if n > 32:
+                n, self._sampled = 32, now
+            else:
+                self._sampled += n / self._rate
+            buff[0] = n
+        elif reg == self._INT_SOURCE:
+            buff[0] = self._regs[reg]
+            self._regs[reg] = 0
+        else:
+            buff[:] = pack("<hhh", *self._acc)
+
+    def _events(self) -> None:
+        # Input events are polled also while nobody reads accelerometer (see _poll)
+        if self._regs[self._INT_ENABLE] and not self._polling:
+            self._polling = True
+            get_running_loop().call_later(0.05, self._poll)
+
+        events = pygame.event.get() if pygame else ()
         for event in events:
             if event.type == pygame.KEYDOWN:
+                acc = self._acc
                 if event.key == pygame.K_UP:
                     self._acc = 0, 0, -1000
                 elif event.key == pygame.K_DOWN:
@@ -140,13 +234,107 @@ class I2C:
                     self._acc = -1000, 0, 0
                 elif event.key == pygame.K_a:
                     self._acc = 1000, 0, 0
+                if acc != self._acc:
+                    self._moved = time()
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 x, y = int(event.pos[0] // SPI._step), int(event.pos[1] // SPI._step)
-                SPI._pixels[2].pixel(x, y, not SPI._pixels[2].pixel(x, y))
-                print(SPI._buffs[2])
+                SPI._pixels[-1].pixel(x, y, not SPI._pixels[-1].pixel(x, y))
+                print(SPI._buffs[-1])
 
-        buff = memoryview(buff)
-        buff[:] = pack("<hhh", *self._acc)
+        self._motion()
+
+    def _motion(self) -> None:
+        # Activity and inactivity are linked - each one is reported after the other
+        regs = self._regs
+        if self._active:
+            if time() - self._moved < regs[self._TIME_INACT]:
+                return
+            self._active, src = False, self._INACTIVITY
+            self._still = time()
+        else:
+            if self._moved <= self._still:
+                return
+            self._active, src = True, self._ACTIVITY
+
+        if regs[self._INT_ENABLE] & src:
+            regs[self._INT_SOURCE] |= src
+            Pin._raise()
+
+    def _poll(self) -> None:
+        self._polling = False
+        self._events()
+
+
+class ReplayI2C(I2C):
+    """Accelerometer replaying samples recorded by ``AccRecorder``.
+
+    Record is replayed as motion measured by accelerometer - FIFO is filled by
+    samples at rate set to accelerometer (where each one is the latest recorded
+    sample at its time) in original timing scaled by speed. No sample is dropped,
+    so accelerated replay may be slowed down by polling of accelerometer. Motion
+    interrupts are not evaluated from samples - record counts as activity till
+    its end.
+
+    :param path:     Record file (``HOURGLASS_REPLAY`` environment variable by default)
+    :param speed:    Replay speed (``HOURGLASS_SPEED`` environment variable or 1)
+    """
+
+    _REG_ACC = 0x32
+
+    def __init__(
+        self,
+        scl: Pin = None,
+        sda: Pin = None,
+        freq: int = 0,
+        path: str = None,
+        speed: float = None,
+    ):
+        super().__init__(scl, sda, freq)
+        path = path or environ["HOURGLASS_REPLAY"]
+        self._speed = speed or float(environ.get("HOURGLASS_SPEED", 1))
+        self._times = list()
+        self._samples = list()
+        for t, period, raw in batches(path):
+            n = len(raw) // 6
+            for i in range(n):
+                self._times.append(t + (i + 1 - n) * period)
+                self._samples.append(raw[i * 6 : i * 6 + 6])
+        self._pos = 0
+        self._start = None
+        self._clock = self._times[0] if self._times else 0
+
+    @property
+    def done(self) -> bool:
+        """All samples has been replayed."""
+        return not self._times or self._clock > self._times[-1]
+
+    def readfrom_mem_into(self, addr: int, reg: int, buff: bytearray) -> None:
+        if not self.done:
+            self._moved = time()
+
+        if reg == self._FIFO_STATUS:
+            self._events()
+            now = time()
+            if self._start is None:
+                self._start = now
+            due = self._times[0] + (now - self._start) * 1000 * self._speed
+            due = min(due, self._times[-1])
+            n = int((due - self._clock) * self._rate // 1000) + 1
+            buff[0] = max(0, min(n, 32))
+        elif reg == self._REG_ACC:
+            self._events()
+            times = self._times
+            while self._pos + 1 < len(times) and times[self._pos + 1] <= self._clock:
+                self._pos += 1
+            memoryview(buff)[:] = self._samples[self._pos]
+            self._clock += 1000 / self._rate
+        else:
+            super().readfrom_mem_into(addr, reg, buff)
+
+
+# Recorded accelerometer samples are replayed when record file is given
+if environ.get("HOURGLASS_REPLAY"):
+    I2C = ReplayI2C
 
 
 def reset():
@@ -0,0 +1,94 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+"""Settled sand must not contain any grain which can still move."""
+from common.matrixsand import MatrixSand, SAND_SERIAL, SAND_MARGOLUS
+from common.sandtables import UNITS
+from common.xorshift import XorShift
+import pytest
+
+
+_FILLS = 40
+_STEPS = 1000
+
+
+def _fill(sand, rng: XorShift) -> None:
+    width, height = sand.size
+    for y in range(height):
+        for x in range(width):
+            if rng.getrandbits(1):
+                sand[x, y] = 1
+
+
+def _movable(sand, d: int, rule: int) -> list:
+    """Grains having free pixel in direction of gravity they can reach by rule."""
+    width, height = sand.size
+    ix, iy = UNITS[d]
+    found = list()
+
+    def free(x, y):
+        return 0 <= x < width and 0 <= y < height and not sand[x, y][0]
+
+    for y in range(height):
+        for x in range(width):
+            if not sand[x, y][0]:
+                continue
+
+            if rule == SAND_MARGOLUS:
+                # Pixels of both blocks containing grain laying more in gravity
+                targets = list()
+                for o in range(2):
+                    bx, by = x - (x + o) % 2, y - (y + o) % 2
+                    for cx in bx, bx + 1:
+                        for cy in by, by + 1:
+                            if ix * (cx - x) + iy * (cy - y) > 0:
+                                targets.append((cx, cy))
+            else:
+                targets = (x + ix, y + iy), (x + ix, y), (x, y + iy)
+
+            if [t for t in targets if t != (x, y) and free(*t)]:
+                found.append((x, y))
+
+    return found
+
+
+def _settle(make, rule: int) -> None:
+    rng = XorShift(7)
+    for n in range(_FILLS):
+        for d, (ix, iy) in enumerate(UNITS):
+            sand = make(rule, XorShift(n * 8 + d + 1))
+            _fill(sand, rng)
+            for _ in range(_STEPS):
+                if not sand.iterate(ix, iy):
+                    break
+            else:
+                assert False, f"sand not settled (fill {n}, direction {d})"
+
+            stuck = _movable(sand, d, rule)
+            assert not stuck, f"grains {stuck} can move (fill {n}, direction {d})"
+
+
+def _matrix_sand(rule: int, rng: XorShift) -> MatrixSand:
+    return MatrixSand(8, 8, rule=rule, rng=rng)
+
+
+def test_matrix_sand_serial_settles():
+    _settle(_matrix_sand, SAND_SERIAL)
+
+
+def test_matrix_sand_margolus_settles():
+    _settle(_matrix_sand, SAND_MARGOLUS)
+
+
+def test_matrix_sand_margolus_odd_size_settles():
+    _settle(lambda rule, rng: MatrixSand(7, 5, rule=rule, rng=rng), SAND_MARGOLUS)
+
+
+def test_numpy_sand_settles():
+    pytest.importorskip("numpy")
+    from common.npsand import NumpySand
+
+    def make(rule, rng):
+        return NumpySand(8, 8, rule=rule, rng=rng)
+
+    _settle(make, SAND_SERIAL)
+    _settle(make, SAND_MARGOLUS)
+    _settle(lambda rule, rng: NumpySand(7, 5, rule=rule, rng=rng), SAND_MARGOLUS)
@@ -0,0 +1,42 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+"""Helpers shared by generators of frozen modules."""
+from argparse import ArgumentParser
+from os import path
+
+
+def output(doc: str, module: str) -> str:
+    """Parse command line of generator.
+
+    Generator exits on ``--help`` (or bad arguments) before anything is written.
+
+    :param doc:       Description of generator (module docstring)
+    :param module:    Generated module in ``common`` directory (default output)
+
+    :return:    Path of output file
+    """
+    default = path.join(path.dirname(__file__), "..", "common", module)
+    parser = ArgumentParser(description=doc.split("\n\n")[0])
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=default,
+        help=f"generated module (common/{module} by default)",
+    )
+    return parser.parse_args().output
+
+
+def literal(name: str, data: bytes, width: int = 16) -> str:
+    """Format bytes as literal split to lines.
+
+    :param name:     Name of variable
+    :param data:     Bytes to be formatted
+    :param width:    Count of bytes per line
+
+    :return:    Assignment of bytes literal
+    """
+    lines = [f"{name} = ("]
+    for i in range(0, len(data), width):
+        chunk = "".join([f"\\x{b:02x}" for b in data[i : i + width]])
+        lines.append(f'    b"{chunk}"')
+    lines.append(")")
+    return "\n".join(lines)
@@ -0,0 +1,113 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+"""Generate packed glyph fonts.
+
+All glyphs are packed in one bytes literal (8 rows in ``MONO_HLSB`` format per
+glyph) with index of glyph offsets for each font. Blob is frozen together with
+firmware, so fonts cost just two small index dictionaries during import on
+device (see :class:`common.font.Font`).
+
+Edit glyphs here and regenerate fonts by::
+
+    python3 tools/mkglyphs.py [-o OUTPUT]
+"""
+
+from gentools import literal, output
+
+# Setup application glyphs (timer values and units)
+SETUP = {
+    0: b'\x00\x0c\x12"DH0\x00',
+    1: b"\x00\x00\x04\x08\x108\x00\x00",
+    2: b"\x00\x08\x04>@@0\x00",
+    3: b"\x00\x0c\x122@@0\x00",
+    4: b'\x00\x14\x08\x14"|\x00\x00',
+    5: b"\x00\x0c\x12\x12\x10\x88P ",
+    6: b"\x00\x0c\x12\x12\x0cH0\x00",
+    7: b"\x00\x00\x04\x08p\x80@ ",
+    8: b"\x00\x0c\x122LH0\x00",
+    9: b"\x00\x0c\x120HH0\x00",
+    10: b"0H\x88\x92d\x08\x1c\x00",
+    15: b"0( \xa2D\x08\x1c\x00",
+    20: b"0H\x8c\x92o\x10\x10\x08",
+    25: b"0( \xa2A\x1e\x10\x08",
+    30: b"0H\x88\x96i\x14\x10\x08",
+    35: b"0( \xa6E\x1c\x10\x08",
+    40: b"0H\x88\x92d\n\x1f\x00",
+    45: b"0( \xa2D\n\x1f\x00",
+    50: b"0H\x88\x96e\x04\x14\x08",
+    55: b"0( \xa6E\x04\x14\x08",
+    60: b"0H\x88\x96i\t\x1e\x00",
+    "m": b"\x10 DH1\x12\x0c\x00",
+    "s": b"\x00\x0c\n*(\x18\x00\x00",
+}
+
+# Clock glyphs (units digits and tens digits drawn over them, 100 is leading zero)
+CLOCK = {
+    0: b"\x0c\x12\x11\t\x06\x00\x00\x00",
+    1: b"\x08\x0c\n\x01\x00\x00\x00\x00",
+    2: b"\x0c\x14\x15\x06\x04\x00\x00\x00",
+    3: b"\x0c\x12\x15\x01\x06\x00\x00\x00",
+    4: b"\x08\t\n\x05\x00\x00\x00\x00",
+    5: b"\x08\x10\x0f\x01\x02\x00\x00\x00",
+    6: b"\x10\x16\x19\t\x06\x00\x00\x00",
+    7: b"\x04\n\x12\x02\x01\x00\x00\x00",
+    8: b"\x0c\x14\x1f\x05\x06\x00\x00\x00",
+    9: b"\x0c\x12\x13\r\x01\x00\x00\x00",
+    10: b"\x00\x00\x00@`P\x08\x00",
+    20: b"\x00\x00\x00`\xa0\xa80 ",
+    30: b"\x00\x00\x00`\x90\xa8\x080",
+    40: b"\x00\x00\x00\x00\x80\x90\xa0P",
+    50: b"\x00\x00\x00@\x80x\x08\x10",
+    60: b"\x00\x00\x00\xe00HH0",
+    70: b"\x00\x00\x00 P\x90\x10\x08",
+    80: b"\x00\x00\x00`\xa0\xf8(0",
+    90: b"\x00\x00\x00`\x90\x98h\x08",
+    100: b"\x00\x00\x00`\x90\x88H0",
+}
+
+FONTS = ("glyphs_setup", SETUP), ("glyphs_clock", CLOCK)
+
+
+def pack() -> tuple[bytes, list[dict]]:
+    """Pack glyphs of all fonts to one blob.
+
+    Same glyphs are stored only once.
+
+    :return:    Tuple containing blob and index of glyph offsets for each font
+    """
+    blob = b""
+    offsets = {}
+    indexes = []
+
+    for _, glyphs in FONTS:
+        index = {}
+        for key, rows in glyphs.items():
+            assert len(rows) == 8, key
+            if rows not in offsets:
+                offsets[rows] = len(blob)
+                blob += rows
+            index[key] = offsets[rows]
+        indexes.append(index)
+
+    return blob, indexes
+
+
+def main():
+    out = output(__doc__, "glyphs.py")
+    blob, indexes = pack()
+
+    with open(out, "w") as f:
+        f.write("# MIT license; Copyright (c) 2023 Ondrej Sienczak\n")
+        f.write("#\n# Generated by tools/mkglyphs.py - do not edit.\n")
+        f.write("from .font import Font\n\n")
+        f.write(literal("GLYPHS", blob) + "\n")
+
+        for (name, _), index in zip(FONTS, indexes):
+            f.write(f"\n{name} = Font(\n    GLYPHS,\n    {{\n")
+            for key, offset in index.items():
+                key = f'"{key}"' if isinstance(key, str) else key
+                f.write(f"        {key}: {offset},\n")
+            f.write("    },\n)\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+# MIT license; Copyright (c) 2023 Ondrej Sienczak
+"""Generate transition tables used by sand engines.
+
+Tables are generated on host and stored as bytes literals, so they are
+frozen together with firmware and they cost nothing during import on device.
+
+Usage::
+
+    python3 tools/mksandtables.py [-o OUTPUT]
+"""
+from gentools import literal, output
+
+# Unit vectors of all quantized gravity directions
+UNITS = ((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1))
+
+# Row shift tables (move grains one pixel in X direction)
+SHIFT_NONE = 0
+SHIFT_RIGHT = 1
+SHIFT_LEFT = 2
+
+ROWS = 8
+
+
+def shifts() -> bytes:
+    """Row byte shift tables.
+
+    Each table has 256 entries and maps row byte to row byte where all grains are
+    moved by one pixel in X direction. Grains on the edge of row are dropped as
+    they can not move. Right table is inverse of left table and vice versa
+    (for all values returned by them).
+    """
+    none = bytes(range(256))
+    right = bytes([(i & 0xFE) >> 1 for i in range(256)])
+    left = bytes([(i & 0x7F) << 1 for i in range(256)])
+    return none + right + left
+
+
+def dirs() -> bytes:
+    """Map unit vector to direction index.
+
+    Table is indexed by ``(ix + 1) * 3 + iy + 1``.
+    """
+    table = bytearray(9)
+    for d, (ix, iy) in enumerate(UNITS):
+        table[(ix + 1) * 3 + iy + 1] = d
+    return bytes(table)
+
+
+def moves(ys, dy: int, dx: int) -> list:
+    """Operations moving rows ``ys`` by ``dy`` rows and ``dx`` pixels."""
+    fwd, back = {
+        0: (SHIFT_NONE, SHIFT_NONE),
+        1: (SHIFT_RIGHT, SHIFT_LEFT),
+        -1: (SHIFT_LEFT, SHIFT_RIGHT),
+    }[dx]
+    return [(y, y + dy, fwd, back) for y in ys]
+
+
+def programs() -> tuple:
+    """Programs of row operations for each direction.
+
+    Each program has three sections - move in direction of gravity, slide
+    along Y axis and slide along X axis. Each operation has 4 bytes - source
+    row, destination row, forward shift table and backward shift table.
+
+    :return:    Tuple containing programs blob and index of sections (4 bytes
+                per direction with section boundaries counted in operations).
+    """
+    blob = list()
+    index = bytearray()
+
+    for ix, iy in UNITS:
+        # Rows are processed against gravity, so grains do not see moves
+        # made in the same phase. Floor row can not move in direction Y.
+        ys = range(ROWS - 1) if iy > 0 else range(ROWS - 1, 0, -1)
+
+        if iy:
+            main = moves(ys, iy, ix)
+            slide_y = moves(ys, iy, 0) if ix else []
+            slide_x = moves(range(ROWS), 0, ix) if ix else []
+        else:
+            main = moves(range(ROWS), 0, ix)
+            slide_y = slide_x = []
+
+        start = len(blob)
+        for section in main, slide_y, slide_x:
+            index.append(start)
+            blob += section
+            start = len(blob)
+        index.append(start)
+
+    return bytes([i for op in blob for i in op]), bytes(index)
+
+
+def margolus() -> bytes:
+    """Transition tables of 2x2 Margolus blocks.
+
+    Block pattern has bit 3 for pixel (0, 0), bit 2 for (1, 0), bit 1 for (0, 1)
+    and bit 0 for (1, 1). Each grain moves to free pixel of block laying more in
+    direction of gravity (prefering straight fall when there is choice). When
+    two pixels or two grains are equal, then table variant decides, so there
+    are two tables for each direction.
+
+    Blocks crossing edge of matrix contain walls - pixels which are never free
+    and never move. Each table is therefore indexed by ``walls << 4 | pattern``
+    (256 bytes per table). Pattern contains grains only (no walls).
+    """
+    cells = (0, 0), (1, 0), (0, 1), (1, 1)
+    table = bytearray()
+
+    for ix, iy in UNITS:
+        for variant in range(2):
+            for walls in range(16):
+                wall = [bool(walls & (8 >> i)) for i in range(4)]
+                for pattern in range(16):
+                    if pattern & walls:
+                        # Grain can not be in wall - keep invalid block as is
+                        table.append(pattern)
+                        continue
+
+                    grains = [bool(pattern & (8 >> i)) for i in range(4)]
+
+                    def potential(i):
+                        return ix * cells[i][0] + iy * cells[i][1]
+
+                    def distance(i, j):
+                        (xi, yi), (xj, yj) = cells[i], cells[j]
+                        return abs(xi - xj) + abs(yi - yj)
+
+                    def order(i):
+                        return potential(i), i if variant else -i
+
+                    moved = True
+                    while moved:
+                        moved = False
+                        for i in sorted(range(4), key=order, reverse=True):
+                            if not grains[i]:
+                                continue
+                            free = [
+                                j for j in range(4) if not grains[j] and not wall[j]
+                            ]
+                            free = [j for j in free if potential(j) > potential(i)]
+                            if not free:
+                                continue
+                            free.sort(key=lambda j: (-potential(j), distance(i, j)))
+                            best = [
+                                j
+                                for j in free
+                                if potential(j) == potential(free[0])
+                                and distance(i, j) == distance(i, free[0])
+                            ]
+                            j = best[variant % len(best)]
+                            grains[i], grains[j] = False, True
+                            moved = True
+
+                    table.append(sum([8 >> i for i in range(4) if grains[i]]))
+
+    return bytes(table)
+
+
+def main():
+    out = output(__doc__, "sandtables.py")
+    blob, index = programs()
+
+    with open(out, "w") as f:
+        f.write("# MIT license; Copyright (c) 2023 Ondrej Sienczak\n")
+        f.write("#\n# Generated by tools/mksandtables.py - do not edit.\n\n")
+        f.write(f"UNITS = {UNITS!r}\n\n")
+        f.write(literal("DIRS", dirs()) + "\n\n")
+        f.write(literal("SHIFTS", shifts()) + "\n\n")
+        f.write(literal("PROGRAMS", blob) + "\n\n")
+        f.write(literal("INDEX", index) + "\n\n")
+        f.write(literal("MARGOLUS", margolus()) + "\n")
+
+
+if __name__ == "__main__":
+    main()
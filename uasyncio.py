@@ -5,3 +5,15 @@ from asyncio import *
 
 async def sleep_ms(ms):
     await sleep(ms / 1000)
+
+
+async def wait_for_ms(aw, ms):
+    return await wait_for(aw, ms / 1000)
+
+
+class ThreadSafeFlag(Event):
+    # Emulated interrupts are raised from event loop, so plain event is safe enough
+
+    async def wait(self):
+        await super().wait()
+        self.clear()
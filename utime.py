@@ -7,3 +7,11 @@ _start = time()
 
 def ticks_ms() -> int:
     return round((time() - _start) * 1000)
+
+
+def ticks_diff(a: int, b: int) -> int:
+    return a - b
+
+
+def ticks_add(a: int, b: int) -> int:
+    return a + b